@@ -16,7 +16,7 @@ evaluation (via NumPy). Characteristics include:
 Features
 --------
 - **Symbolic derivation** (derivative/solve and integration) **cached** per
-  (model, characteristic) to avoid recomputation.
+  model to avoid recomputation; the lactation length is substituted afterwards.
 - **Fallback numeric methods** for robustness when the symbolic expression is
   not suitable for lambdification or yields invalid values.
 - Works with frequentist- or Bayesian-fitted parameters via the
@@ -33,13 +33,14 @@ Author: Meike van Leerdam
 Last update: 11-feb-2025
 """
 
+import math
+
 import numpy as np
 from sympy import (
     diff,
     exp,
     integrate,
     lambdify,
-    ln,
     log,
     nan,
     oo,
@@ -87,54 +88,33 @@ def is_valid_sympy_expr(expr) -> bool:
 
 # Store derived function in cache so they do not need to be calculated all the time again.
 _LCC_CACHE = {}
+# Symbolic derivations shared by all characteristics and lactation lengths of a model.
+_LCC_DERIVATIONS = {}
+# Symbolic end of lactation; substituted by the requested lactation length.
+_T = symbols("T", real=True, positive=True)
 
 
-def lactation_curve_characteristic_function(
-    model="wood", characteristic=None, lactation_length=305
-) -> tuple:
-    """Build (or fetch from cache) a symbolic expression and fast numeric function for an LCC.
-
-    This function derives the requested **lactation curve characteristic** for a given
-    model using SymPy (derivative / root finding / integration). It returns the symbolic
-    expression, the tuple of parameter symbols (argument order), and a lambdified
-    numeric function that can be evaluated with numerical parameters.
+def _derive_model_expressions(model: str) -> dict:
+    """Derive (or fetch from cache) the symbolic characteristics of a model.
 
-    The symbolic derivation and integration are done only once per (model, characteristic)
-    and then **cached** for reuse.
+    The derivation is shared by all characteristics of a model and cached per model.
+    Cumulative milk yield and persistency are derived up to the symbolic end of
+    lactation `_T`, so a new lactation length only needs a substitution.
 
     Args:
-        model (str): Model name. Options:
-            'milkbot', 'wood', 'wilmink', 'ali_schaeffer', 'fischer',
-            'brody', 'sikka', 'nelder', 'dhanoa', 'emmans', 'hayashi',
-            'rook', 'dijkstra', 'prasad'.
-        characteristic (str | None): Desired characteristic. Options:
-            'time_to_peak', 'peak_yield', 'cumulative_milk_yield', 'persistency'.
-            If `None` or unrecognized, a dict of all available characteristics is returned
-            (with `persistency` possibly `None` if derivation is not feasible).
-        lactation_length (int): Length of lactation in days used in persistency
-            computation (default 305).
+        model: Lowercase model name.
 
     Returns:
-        tuple:
-            expr: SymPy expression (or dict of expressions if `characteristic` is None).
-            params: Tuple of SymPy symbols for model parameters (argument order).
-            func: Lambdified numeric function `f(*params)` (or dict of functions).
+        Dict with the sorted parameter symbols (``"params"``) and the expressions
+        for ``"time_to_peak"``, ``"peak_yield"``, ``"persistency"`` and
+        ``"cumulative_milk_yield"``; peak and persistency entries are None when
+        no closed form exists.
 
     Raises:
-        Exception: If the model is unknown, or if no positive real solution for
-            peak timing/yield exists where required.
+        Exception: If the model is unknown.
     """
-    # check the cache
-    storage = (model, characteristic)
-    if storage in _LCC_CACHE:
-        return (
-            _LCC_CACHE[storage]["expr"],
-            _LCC_CACHE[storage]["params"],
-            _LCC_CACHE[storage]["func"],
-        )
-
-    # make sure model is all lowercase
-    model = model.lower()
+    if model in _LCC_DERIVATIONS:
+        return _LCC_DERIVATIONS[model]
 
     # define functions
     if model == "brody":
@@ -217,56 +197,121 @@ def lactation_curve_characteristic_function(
     # solve derivative for when it is zero to find the function for time of peak
     tpeak = solve(fdiff, t)
 
-    # define the end of lactation
-    T = lactation_length  # days in milk
-
-    # Persistency = average slope after peak, does not work for all models so therefore try except
+    # Persistency = average slope after peak until the end of lactation _T
     persistency = None
-    try:
-        if tpeak:
-            tmp = (function.subs(t, T) - function.subs(t, tpeak[0])) / (T - tpeak[0])
-            tmp = tmp.cancel()  # light simplification
-            if is_valid_sympy_expr(tmp):
-                persistency = tmp
-    except Exception:
-        persistency = None
+    if tpeak:
+        persistency = (function.subs(t, _T) - function.subs(t, tpeak[0])) / (_T - tpeak[0])
 
-    if characteristic != "cumulative_milk_yield":
-        if tpeak:  # Check if the list is not empty
-            peak_expr = simplify(function.subs(t, tpeak[0]))
-        else:
-            raise Exception("No positive real solution for time to peak and peak yield found")
+    peak_expr = simplify(function.subs(t, tpeak[0])) if tpeak else None
 
-    # find function for cumulative milk yield of the lactation.
+    # find function for cumulative milk yield of the lactation up to _T.
     # A lactation length of 305 is the default, but this value can
     # also be provided as a parameter in the characteristic function.
-    cum_my_expr = integrate(function, (t, 0, lactation_length))
+    cum_my_expr = integrate(function, (t, 0, _T))
 
     # Sorted parameter list (exclude t)
     params = tuple(
         sorted([s for s in function.free_symbols if s.name != "t"], key=lambda x: x.name)
     )
 
+    _LCC_DERIVATIONS[model] = {
+        "params": params,
+        "time_to_peak": tpeak[0] if tpeak else None,
+        "peak_yield": peak_expr,
+        "persistency": persistency,
+        "cumulative_milk_yield": cum_my_expr,
+    }
+    return _LCC_DERIVATIONS[model]
+
+
+def _persistency_at_length(persistency, lactation_length):
+    """Substitute the lactation length into the derived persistency expression.
+
+    Persistency does not work for all models, so None is returned when the
+    expression is missing, cannot be simplified or is not valid.
+    """
+    if persistency is None:
+        return None
+    try:
+        tmp = persistency.subs(_T, lactation_length).cancel()  # light simplification
+    except Exception:
+        return None
+    return tmp if is_valid_sympy_expr(tmp) else None
+
+
+def lactation_curve_characteristic_function(
+    model="wood", characteristic=None, lactation_length=305
+) -> tuple:
+    """Build (or fetch from cache) a symbolic expression and fast numeric function for an LCC.
+
+    This function derives the requested **lactation curve characteristic** for a given
+    model using SymPy (derivative / root finding / integration). It returns the symbolic
+    expression, the tuple of parameter symbols (argument order), and a lambdified
+    numeric function that can be evaluated with numerical parameters.
+
+    The symbolic derivation and integration are done only once per model and then
+    **cached** for reuse; the lambdified function is cached per
+    (model, characteristic, lactation_length), so repeated calls return the same
+    expression and function objects.
+
+    Args:
+        model (str): Model name. Options:
+            'milkbot', 'wood', 'wilmink', 'ali_schaeffer', 'fischer',
+            'brody', 'sikka', 'nelder', 'dhanoa', 'emmans', 'hayashi',
+            'rook', 'dijkstra', 'prasad'.
+        characteristic (str | None): Desired characteristic. Options:
+            'time_to_peak', 'peak_yield', 'cumulative_milk_yield', 'persistency'.
+            If `None` or unrecognized, a dict of all available characteristics is returned
+            (with `persistency` possibly `None` if derivation is not feasible).
+        lactation_length (int): Length of lactation in days used in persistency
+            computation (default 305).
+
+    Returns:
+        tuple:
+            expr: SymPy expression (or dict of expressions if `characteristic` is None).
+            params: Tuple of SymPy symbols for model parameters (argument order).
+            func: Lambdified numeric function `f(*params)` (or dict of functions).
+
+    Raises:
+        Exception: If the model is unknown, or if no positive real solution for
+            peak timing/yield exists where required.
+    """
+    # make sure model is all lowercase
+    model = model.lower()
+
+    # check the cache; cumulative yield and persistency depend on the lactation length
+    storage = (model, characteristic, lactation_length)
+    if storage in _LCC_CACHE:
+        return (
+            _LCC_CACHE[storage]["expr"],
+            _LCC_CACHE[storage]["params"],
+            _LCC_CACHE[storage]["func"],
+        )
+
+    derived = _derive_model_expressions(model)
+    params = derived["params"]
+    if characteristic != "cumulative_milk_yield" and derived["time_to_peak"] is None:
+        raise Exception("No positive real solution for time to peak and peak yield found")
+
     # ----------------------------------------------------
     # Select requested characteristic
     # ----------------------------------------------------
-    if characteristic == "time_to_peak":
-        expr = tpeak[0]
-    elif characteristic == "peak_yield":
-        expr = peak_expr
+    if characteristic in ("time_to_peak", "peak_yield"):
+        expr = derived[characteristic]
     elif characteristic == "cumulative_milk_yield":
-        expr = cum_my_expr
+        expr = derived["cumulative_milk_yield"].subs(_T, lactation_length)
     elif characteristic == "persistency":
-        if persistency is None:
+        expr = _persistency_at_length(derived["persistency"], lactation_length)
+        if expr is None:
             raise Exception("Persistency could not be computed symbolically")
-        expr = persistency
     else:
         # Return all four if None or 'all'
         expr = {
-            "time_to_peak": tpeak[0],
-            "peak_yield": peak_expr,
-            "persistency": persistency,  # possibly None
-            "cumulative_milk_yield": cum_my_expr,
+            "time_to_peak": derived["time_to_peak"],
+            "peak_yield": derived["peak_yield"],
+            # possibly None
+            "persistency": _persistency_at_length(derived["persistency"], lactation_length),
+            "cumulative_milk_yield": derived["cumulative_milk_yield"].subs(_T, lactation_length),
         }
 
     # ----------------------------------------------------
@@ -274,12 +319,12 @@ def lactation_curve_characteristic_function(
     # ----------------------------------------------------
     if isinstance(expr, dict):
         func = {
-            name: lambdify(params, ex, modules=["numpy", "scipy"])
+            name: lambdify(params, ex, modules=["numpy", "scipy"], cse=True)
             for name, ex in expr.items()
             if ex is not None
         }
     else:
-        func = lambdify(params, expr, modules=["numpy", "scipy"])
+        func = lambdify(params, expr, modules=["numpy", "scipy"], cse=True)
 
     # ----------------------------------------------------
     # Store in cache
@@ -693,8 +738,11 @@ def persistency_wood(b, c) -> float:
 
     Returns:
         float: Persistency value from the Wood formula.
+
+    Raises:
+        ValueError: If `c` is not positive.
     """
-    return float(-(b + 1) * ln(c))
+    return float(-(b + 1) * math.log(c))
 
 
 def persistency_milkbot(d) -> float:
@@ -31,6 +31,7 @@ Notes
 Author: Meike van Leerdam, Date: 07-31-2025
 """
 
+import numpy as np
 import pandas as pd
 
 from lactationcurve.preprocessing import standardize_lactation_columns
@@ -42,7 +43,7 @@ def test_interval_method(
     milking_yield_col: str | None = None,
     test_id_col: str | None = None,
     default_test_id: int = 0,
-    max_dim: int = 305,
+    max_dim: int | str = 305,
 ) -> pd.DataFrame:
     """Compute 305-day total milk yield using the ICAR Test Interval Method.
 
@@ -60,6 +61,8 @@ def test_interval_method(
         test_id_col (str | None): Optional column name override for TestId.
         default_test_id (Any): If TestId is missing, a new `TestId` column is created
             with this value.
+        max_dim (int | str): Records with a larger DIM are dropped; "max" keeps all
+            records.
 
     Returns:
         pd.DataFrame: Two-column DataFrame with
@@ -75,52 +78,63 @@ def test_interval_method(
           otherwise the lactation is skipped.
     """
 
-    # Standardize columns and filter DIM <= 305
+    # Standardize columns; the DIM filter is applied to the extracted arrays below
     df = standardize_lactation_columns(
         df,
         days_in_milk_col=days_in_milk_col,
         milking_yield_col=milking_yield_col,
         test_id_col=test_id_col,
         default_test_id=default_test_id,
-        max_dim=max_dim,
+        max_dim="max",
     )
 
-    result = []
-
-    # Iterate over each lactation
-    for lactation in df["TestId"].unique():
-        lactation_df = pd.DataFrame(df[df["TestId"] == lactation])
-
-        # Sort by DaysInMilk ascending
-        lactation_df.sort_values(by="DaysInMilk", ascending=True, inplace=True)
-
-        if len(lactation_df) < 2:
-            print(f"Skipping TestId {lactation}: not enough data points for interpolation.")
-            continue
-
-        # Start and end points
-        start = lactation_df.iloc[0]
-        end = lactation_df.iloc[-1]
-
-        # Start contribution
-        MY0 = start["DaysInMilk"] * start["MilkingYield"]
-
-        # End contribution
-        MYend = (306 - end["DaysInMilk"]) * end["MilkingYield"]
-
-        # Intermediate trapezoidal contributions
-        lactation_df["width"] = lactation_df["DaysInMilk"].diff().shift(-1)
-        lactation_df["avg_yield"] = (
-            lactation_df["MilkingYield"] + lactation_df["MilkingYield"].shift(-1)
-        ) / 2
-        lactation_df["trapezoid_area"] = lactation_df["width"] * lactation_df["avg_yield"]
-
-        total_intermediate = lactation_df["trapezoid_area"].sum()
-
-        total_yield = MY0 + total_intermediate + MYend
-        result.append((lactation, total_yield))
-
-    return pd.DataFrame(result, columns=["TestId", "LactationMilkYield"])
+    # Keep records with DIM <= max_dim and sort them by lactation (order of first
+    # appearance) and DIM. Records usually arrive in DIM order within a lactation,
+    # so a cheap stable sort on the lactation codes is tried before a full lexsort.
+    dim = df["DaysInMilk"].to_numpy()
+    if isinstance(max_dim, str) and max_dim.lower() == "max":
+        in_range = np.ones(len(dim), dtype=bool)
+    else:
+        in_range = dim <= int(max_dim)
+    dim = dim[in_range].astype(np.float64)
+    milk = df["MilkingYield"].to_numpy()[in_range].astype(np.float64)
+    codes, lactations = pd.factorize(df["TestId"][in_range])
+    order = np.argsort(codes, kind="stable")
+    if not np.all((np.diff(codes[order]) != 0) | (np.diff(dim[order]) >= 0)):
+        order = np.lexsort((dim, codes))
+    order = order[codes[order] >= 0]
+    dim = dim[order]
+    milk = milk[order]
+    bounds = np.searchsorted(codes[order], np.arange(len(lactations) + 1))
+    counts = np.diff(bounds)
+
+    for lactation in lactations[counts < 2]:
+        print(f"Skipping TestId {lactation}: not enough data points for interpolation.")
+
+    keep = np.flatnonzero(counts >= 2)
+    starts = bounds[keep]
+    ends = bounds[keep + 1] - 1
+
+    # Start and end contributions
+    MY0 = dim[starts] * milk[starts]
+    MYend = (306 - dim[ends]) * milk[ends]
+
+    # Intermediate trapezoidal contributions; the trapezoids spanning two lactations
+    # are zeroed and missing yields are skipped, as in a pandas sum
+    total_intermediate = np.zeros(len(keep))
+    if len(keep):
+        trapezoid_area = np.diff(dim) * (milk[1:] + milk[:-1]) / 2
+        trapezoid_area[bounds[1:-1] - 1] = 0.0
+        trapezoid_area[np.isnan(trapezoid_area)] = 0.0
+        total_intermediate = np.add.reduceat(trapezoid_area, starts)
+
+    # Build the result from whole columns rather than row tuples
+    return pd.DataFrame(
+        {
+            "TestId": np.asarray(lactations[keep], dtype=lactations.dtype),
+            "LactationMilkYield": MY0 + total_intermediate + MYend,
+        }
+    )
 
 
 # to prevent pytest from trying to collect this function as a test
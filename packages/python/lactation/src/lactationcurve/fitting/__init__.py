@@ -2,6 +2,7 @@
 
 from .lactation_curve_fitting import (
     ali_schaeffer_model,
+    bayesian_fit_milkbot_batch,
     bayesian_fit_milkbot_single_lactation,
     brody_model,
     build_prior,
@@ -10,6 +11,7 @@ from .lactation_curve_fitting import (
     emmans_model,
     fischer_model,
     fit_lactation_curve,
+    fit_lactation_curve_batch,
     get_chen_priors,
     get_lc_parameters,
     get_lc_parameters_least_squares,
@@ -25,6 +27,7 @@ from .lactation_curve_fitting import (
 
 __all__ = [
     "ali_schaeffer_model",
+    "bayesian_fit_milkbot_batch",
     "bayesian_fit_milkbot_single_lactation",
     "brody_model",
     "dhanoa_model",
@@ -32,6 +35,7 @@ __all__ = [
     "emmans_model",
     "fischer_model",
     "fit_lactation_curve",
+    "fit_lactation_curve_batch",
     "get_chen_priors",
     "get_lc_parameters",
     "get_lc_parameters_least_squares",
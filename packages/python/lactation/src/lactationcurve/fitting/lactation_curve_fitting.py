@@ -46,9 +46,17 @@ Public functions
   Fit a lactation curve to the provided data and return predicted milk yield
   for each day in milk (DIM) in the range 1–305 (or up to the maximum DIM if it exceeds 305).
 
+- fit_lactation_curve_batch(df, model="wood")
+  Fit the same model to every lactation (TestId) in a DataFrame and return the
+  predicted curves on a shared DIM range.
+
+- bayesian_fit_milkbot_batch(df, key)
+  Fit every lactation (TestId) in a DataFrame with the MilkBot API, sending
+  the requests concurrently, and return the fitted parameters.
+
 - get_lc_parameters(dim, milkrecordings, model="wood")
   Fit a lactation curve to the provided data and return model parameters using
-  frequentist statistics: minimize/curve_fit.
+  frequentist statistics: least_squares/curve_fit.
 
 - get_lc_parameters_least_squares(dim, milkrecordings, model="milkbot")
   Fit a lactation curve to the provided data and return model parameters using
@@ -64,20 +72,42 @@ Notes
   parity, continent, and custom priors.
 - For information on the fitting API see https://api.milkbot.com/
   or contact Jim Ehrlich, DVM: jehrlich@MilkBot.com
+- Frequentist fits are kept in an in-memory LRU cache of up to
+  `_PARAMETER_CACHE_SIZE` entries, shared by all threads. Clear it with
+  `_PARAMETER_CACHE.clear()`; set `_PARAMETER_CACHE_SIZE = 0` to disable it.
+  MilkBot API results are cached the same way in `_BAYESIAN_CACHE`
+  (`_BAYESIAN_CACHE_SIZE`), keyed by a digest of the API key, never the key itself.
 """
 
 # packages
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
 import numpy as np
-import requests
-from scipy.optimize import curve_fit, least_squares, minimize
+import pandas as pd
+from scipy.optimize import curve_fit, least_squares
 
-from lactationcurve.preprocessing import validate_and_prepare_inputs
+from lactationcurve.preprocessing import (
+    standardize_lactation_columns,
+    validate_and_prepare_inputs,
+)
 from lactationcurve.preprocessing.validate_and_standardize import MilkBotPriors
 
+if TYPE_CHECKING:
+    import requests
+
 
 # --- Models ---
+_LN305 = np.log(305.0)
+
+
 def milkbot_model(t, a, b, c, d) -> np.floating | np.ndarray:
     """MilkBot lactation curve model.
 
@@ -153,8 +183,8 @@ def ali_schaeffer_model(t, a, b, c, d, k) -> np.floating | np.ndarray:
         Uses `t_scaled = t / 305` and `log_term = ln(305 / t)`.
     """
     t_scaled = t / 305
-    log_term = np.log(305 / t)
-    return a + b * t_scaled + c * (t_scaled**2) + d * log_term + k * (log_term**2)
+    log_term = _LN305 - np.log(t)
+    return a + b * t_scaled + c * t_scaled * t_scaled + d * log_term + k * log_term * log_term
 
 
 def fischer_model(t, a, b, c) -> np.floating | np.ndarray:
@@ -308,9 +338,10 @@ def dijkstra_model(t, a, b, c, d) -> float:
         Predicted milk yield at `t`.
 
     Notes:
-        Formula: `y(t) = a * exp((b * (1 - exp(-c * t)) / c) - d * t)`.
+        Formula: `y(t) = a * exp((b * (1 - exp(-c * t)) / c) - d * t)`,
+        evaluated with `expm1` to stay accurate for small `c * t`.
     """
-    return a * np.exp((b * (1 - np.exp(-c * t)) / c) - d * t)
+    return a * np.exp((-b * np.expm1(-c * t) / c) - d * t)
 
 
 def prasad_model(t, a, b, c, d) -> float:
@@ -332,9 +363,123 @@ def prasad_model(t, a, b, c, d) -> float:
     return a + b * t + c * t**2 + d / t
 
 
-# objectives for minimize
-def wood_objective(par, x, y) -> float:
-    """Objective function (sum of squared errors) for the Wood model.
+# --- Jacobians ---
+# Analytic partial derivatives of the fitted models with respect to their parameters.
+# Each returns an `(n, p)` array that is passed to `curve_fit`/`least_squares` via `jac`,
+# so SciPy does not have to estimate it with finite differences.
+def milkbot_jacobian(t, a, b, c, d) -> np.ndarray:
+    """Jacobian of the MilkBot model with respect to `(a, b, c, d)`.
+
+    Args:
+        t: DIM values.
+        a: Scale parameter.
+        b: Ramp parameter.
+        c: Offset parameter.
+        d: Decay parameter.
+
+    Returns:
+        Array of shape `(len(t), 4)` with the partial derivatives.
+    """
+    t = np.asarray(t, dtype=float)
+    ramp = np.exp((c - t) / b)
+    decay = np.exp(-d * t)
+    scale_term = (1 - ramp / 2) * decay
+    ramp_term = a * ramp * decay / (2 * b)
+    return np.column_stack((scale_term, ramp_term * (c - t) / b, -ramp_term, -a * t * scale_term))
+
+
+def wood_jacobian(t, a, b, c) -> np.ndarray:
+    """Jacobian of the Wood model with respect to `(a, b, c)`.
+
+    Args:
+        t: DIM values (`t > 0`).
+        a: Scale parameter.
+        b: Shape parameter.
+        c: Decay parameter.
+
+    Returns:
+        Array of shape `(len(t), 3)` with the partial derivatives.
+    """
+    t = np.asarray(t, dtype=float)
+    base = t**b * np.exp(-c * t)
+    return np.column_stack((base, a * base * np.log(t), -a * t * base))
+
+
+def wilmink_jacobian(t, a, b, c, k=-0.05) -> np.ndarray:
+    """Jacobian of the Wilmink model with respect to `(a, b, c)` for a fixed `k`.
+
+    Args:
+        t: DIM values.
+        a: Intercept-like parameter.
+        b: Linear trend coefficient.
+        c: Exponential-term scale.
+        k: Fixed exponential rate, default -0.05.
+
+    Returns:
+        Array of shape `(len(t), 3)` with the partial derivatives.
+    """
+    t = np.asarray(t, dtype=float)
+    return np.column_stack((np.ones_like(t), t, np.exp(k * t)))
+
+
+def ali_schaeffer_jacobian(t, a, b, c, d, k) -> np.ndarray:
+    """Jacobian of the Ali & Schaeffer model with respect to `(a, b, c, d, k)`.
+
+    Args:
+        t: DIM values (`t >= 1`).
+        a: Intercept-like parameter.
+        b: Linear coefficient on scaled time.
+        c: Quadratic coefficient on scaled time.
+        d: Coefficient on `log(305/t)`.
+        k: Coefficient on `[log(305/t)]^2`.
+
+    Returns:
+        Array of shape `(len(t), 5)` with the partial derivatives.
+    """
+    t = np.asarray(t, dtype=float)
+    t_scaled = t / 305
+    log_term = _LN305 - np.log(t)
+    return np.column_stack((np.ones_like(t), t_scaled, t_scaled**2, log_term, log_term**2))
+
+
+def fischer_jacobian(t, a, b, c) -> np.ndarray:
+    """Jacobian of the Fischer model with respect to `(a, b, c)`.
+
+    Args:
+        t: DIM values.
+        a: Scale parameter.
+        b: Linear decline parameter.
+        c: Exponential decay parameter.
+
+    Returns:
+        Array of shape `(len(t), 3)` with the partial derivatives.
+    """
+    t = np.asarray(t, dtype=float)
+    decay = np.exp(-c * t)
+    return np.column_stack((1 - decay, -t, a * t * decay))
+
+
+# models that can be fitted with frequentist statistics
+_FREQUENTIST_MODELS = {
+    "wood": wood_model,
+    "wilmink": wilmink_model,
+    "ali_schaeffer": ali_schaeffer_model,
+    "fischer": fischer_model,
+    "milkbot": milkbot_model,
+}
+
+
+def _frequentist_model_name(model) -> str:
+    """Normalize a frequentist model name, raising for anything that is not a known model."""
+    name = model.strip().lower() if isinstance(model, str) else ""
+    if name not in _FREQUENTIST_MODELS:
+        raise Exception("Unknown model")
+    return name
+
+
+# residuals for least squares
+def residuals_wood(par, x, y) -> np.ndarray:
+    """Residuals for least-squares fitting of the Wood model.
 
     Args:
         par: Parameter vector `(a, b, c)`.
@@ -342,23 +487,23 @@ def wood_objective(par, x, y) -> float:
         y: Observed milk yields.
 
     Returns:
-        Sum of squared residuals between observed values and Wood model predictions.
+        Vector of residuals `y - y_pred`.
     """
-    return np.sum((y - wood_model(x, *par)) ** 2)
+    return y - wood_model(x, *par)
 
 
-def milkbot_objective(par, x, y) -> float:
-    """Objective function (sum of squared errors) for the MilkBot model.
+def residuals_wood_jacobian(par, x, y) -> np.ndarray:
+    """Jacobian of `residuals_wood` with respect to the parameters.
 
     Args:
-        par: Parameter vector `(a, b, c, d)`.
+        par: Parameter vector `(a, b, c)`.
         x: DIM values.
-        y: Observed milk yields.
+        y: Observed milk yields (unused; part of the residual signature).
 
     Returns:
-        Sum of squared residuals between observed values and MilkBot predictions.
+        Array of shape `(len(x), 3)`; the negated Wood model Jacobian.
     """
-    return np.sum((y - milkbot_model(x, *par)) ** 2)
+    return -wood_jacobian(x, *par)
 
 
 def residuals_milkbot(par, x, y) -> np.ndarray:
@@ -375,6 +520,108 @@ def residuals_milkbot(par, x, y) -> np.ndarray:
     return y - milkbot_model(x, *par)
 
 
+def residuals_milkbot_jacobian(par, x, y) -> np.ndarray:
+    """Jacobian of `residuals_milkbot` with respect to the parameters.
+
+    Args:
+        par: Parameter vector `(a, b, c, d)`.
+        x: DIM values.
+        y: Observed milk yields (unused; part of the residual signature).
+
+    Returns:
+        Array of shape `(len(x), 4)`; the negated MilkBot model Jacobian.
+    """
+    return -milkbot_jacobian(x, *par)
+
+
+class _WoodResiduals:
+    """Wood residuals and Jacobian for one lactation, sharing `t**b * exp(-c*t)`.
+
+    `log(t)` is computed once per fit, so every evaluation needs a single `exp`
+    instead of a power and an exponential, and the Jacobian reuses the term from
+    the residuals at the same parameter vector. At `t = 0` the curve and all its
+    derivatives are zero (`b > 0` within the fit bounds).
+
+    Args:
+        x: DIM values.
+        y: Observed milk yields.
+    """
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        with np.errstate(divide="ignore"):
+            self.log_x = np.log(self.x)
+        # d/db of t**b is t**b * log(t), which tends to 0 at t = 0
+        self._jac_log_x = np.where(self.x > 0, self.log_x, 0.0)
+        self._par = None
+        self._base = None
+
+    def _update(self, par):
+        if self._par is None or not np.array_equal(par, self._par):
+            _, b, c = par
+            self._base = np.exp(b * self.log_x - c * self.x)
+            self._par = np.array(par, dtype=float)
+
+    def residuals(self, par) -> np.ndarray:
+        """Residuals `y - y_pred` for parameter vector `(a, b, c)`."""
+        self._update(par)
+        return self.y - par[0] * self._base
+
+    def jacobian(self, par) -> np.ndarray:
+        """Jacobian of `residuals` with respect to `(a, b, c)`."""
+        self._update(par)
+        a = par[0]
+        jac = np.empty((self.x.shape[0], 3))
+        np.negative(self._base, out=jac[:, 0])
+        np.multiply(jac[:, 0], a * self._jac_log_x, out=jac[:, 1])
+        np.multiply(jac[:, 0], -a * self.x, out=jac[:, 2])
+        return jac
+
+
+class _MilkBotResiduals:
+    """MilkBot residuals and Jacobian for one lactation, sharing their exponentials.
+
+    `least_squares` evaluates the Jacobian at the point where it last evaluated the
+    residuals, so both exponentials of the model are computed once per parameter
+    vector and reused.
+
+    Args:
+        x: DIM values.
+        y: Observed milk yields.
+    """
+
+    def __init__(self, x, y):
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self._par = None
+        self._ramp = self._decay = None
+
+    def _update(self, par):
+        if self._par is None or not np.array_equal(par, self._par):
+            _, b, c, d = par
+            self._ramp = np.exp((c - self.x) / b)
+            self._decay = np.exp(-d * self.x)
+            self._par = np.array(par, dtype=float)
+
+    def residuals(self, par) -> np.ndarray:
+        """Residuals `y - y_pred` for parameter vector `(a, b, c, d)`."""
+        self._update(par)
+        return self.y - par[0] * (1 - self._ramp / 2) * self._decay
+
+    def jacobian(self, par) -> np.ndarray:
+        """Jacobian of `residuals` with respect to `(a, b, c, d)`."""
+        self._update(par)
+        a, b, c, _ = par
+        jac = np.empty((self.x.shape[0], 4))
+        np.multiply(self._ramp / 2 - 1, self._decay, out=jac[:, 0])
+        ramp_term = a * self._ramp * self._decay / (2 * b)
+        jac[:, 1] = ramp_term * (self.x - c) / b
+        jac[:, 2] = ramp_term
+        jac[:, 3] = -a * self.x * jac[:, 0]
+        return jac
+
+
 def fit_lactation_curve(
     dim,
     milkrecordings,
@@ -386,11 +633,12 @@ def fit_lactation_curve(
     custom_priors=None,
     key=None,
     milk_unit="kg",
+    dtype=np.float64,
 ) -> np.ndarray:
     """Fit lactation data to a lactation curve model and return predictions.
 
     Depending on `fitting`:
-    - **frequentist**: Fits parameters using `minimize` and/or `curve_fit`
+    - **frequentist**: Fits parameters using `least_squares` or `curve_fit`
       for the specified `model`, then predicts over DIM 1–305 (or up to `max(dim)` if greater).
     - **bayesian**: (MilkBot only) Calls the MilkBot Bayesian fitting API and
       returns predictions using the fitted parameters.
@@ -420,6 +668,9 @@ def fit_lactation_curve(
         milk_unit (Str): Unit of milk yield measurements. Must be either "kg" or "lbs".
             Default is "kg".
             Only used for Bayesian.
+        dtype: Floating point dtype of the returned curve, default `np.float64`.
+            Parameters are always fitted in float64; `np.float32` halves the size
+            of the returned array.
 
 
     Returns:
@@ -456,69 +707,16 @@ def fit_lactation_curve(
     custom_priors = inputs.custom_priors
     milk_unit = inputs.milk_unit
 
-    if fitting == "frequentist":
-        if model == "wood":
-            params = get_lc_parameters(dim, milkrecordings, model)
-            assert params is not None, "Failed to fit Wood model parameters"
-            a_w, b_w, c_w = params[0], params[1], params[2]
-            if max(dim) > 305:
-                t_range = np.arange(1, (max(dim) + 1))
-                y_w = wood_model(t_range, a_w, b_w, c_w)
-            else:
-                t_range = np.arange(1, 306)
-                y_w = wood_model(t_range, a_w, b_w, c_w)
-            return np.asarray(y_w)
-
-        elif model == "wilmink":
-            params = get_lc_parameters(dim, milkrecordings, model)
-            assert params is not None, "Failed to fit Wilmink model parameters"
-            a_wil, b_wil, c_wil, k_wil = (params[0], params[1], params[2], params[3])
-            if max(dim) > 305:
-                t_range = np.arange(1, (max(dim) + 1))
-                y_wil = wilmink_model(t_range, a_wil, b_wil, c_wil, k_wil)
-            else:
-                t_range = np.arange(1, 306)
-                y_wil = wilmink_model(t_range, a_wil, b_wil, c_wil, k_wil)
-            return np.asarray(y_wil)
-
-        elif model == "ali_schaeffer":
-            params = get_lc_parameters(dim, milkrecordings, model)
-            assert params is not None, "Failed to fit Ali & Schaeffer model parameters"
-            a_as, b_as, c_as, d_as, k_as = (params[0], params[1], params[2], params[3], params[4])
-            if max(dim) > 305:
-                t_range = np.arange(1, (max(dim) + 1))
-                y_as = ali_schaeffer_model(t_range, a_as, b_as, c_as, d_as, k_as)
-            else:
-                t_range = np.arange(1, 306)
-                y_as = ali_schaeffer_model(t_range, a_as, b_as, c_as, d_as, k_as)
-            return np.asarray(y_as)
-
-        elif model == "fischer":
-            params = get_lc_parameters(dim, milkrecordings, model)
-            assert params is not None, "Failed to fit Fischer model parameters"
-            a_f, b_f, c_f = params[0], params[1], params[2]
-            if max(dim) > 305:
-                t_range = np.arange(1, (max(dim) + 1))
-                y_f = fischer_model(t_range, a_f, b_f, c_f)
-            else:
-                t_range = np.arange(1, 306)
-                y_f = fischer_model(t_range, a_f, b_f, c_f)
-            return np.asarray(y_f)
-
-        elif model == "milkbot":
-            params = get_lc_parameters(dim, milkrecordings, model)
-            assert params is not None, "Failed to fit MilkBot model parameters"
-            a_mb, b_mb, c_mb, d_mb = (params[0], params[1], params[2], params[3])
-            if max(dim) > 305:
-                t_range = np.arange(1, (max(dim) + 1))
-            else:
-                t_range = np.arange(1, 306)
-
-            y_mb = milkbot_model(t_range, a_mb, b_mb, c_mb, d_mb)
-            return np.asarray(y_mb)
+    # predict over DIM 1-305, or up to the last test day for longer lactations
+    dim_max = int(np.ceil(dim.max()))
+    t_range = np.arange(1, max(dim_max, 305) + 1, dtype=np.float64)
 
-        else:
-            raise Exception("Unknown model")
+    if fitting == "frequentist":
+        model = _frequentist_model_name(model)
+        model_function = _FREQUENTIST_MODELS[model]
+        params = _fit_parameters_cached(dim, milkrecordings, model)
+        assert params is not None, f"Failed to fit {model} model parameters"
+        return np.asarray(model_function(t_range, *params), dtype=dtype)
     else:
         if model == "milkbot":
             if key is None:
@@ -527,7 +725,7 @@ def fit_lactation_curve(
                 assert parity is not None, "parity is required for Bayesian fitting"
                 assert breed is not None, "breed is required for Bayesian fitting"
                 assert continent is not None, "continent is required for Bayesian fitting"
-                parameters = bayesian_fit_milkbot_single_lactation(
+                parameters = _bayesian_fit_milkbot_cached(
                     dim,
                     milkrecordings,
                     key,
@@ -537,29 +735,133 @@ def fit_lactation_curve(
                     continent,
                     milk_unit or "kg",
                 )
-                if max(dim) > 305:
-                    t_range = np.arange(1, (max(dim) + 1))
-                    y_mb_bay = milkbot_model(
-                        t_range,
-                        parameters["scale"],
-                        parameters["ramp"],
-                        parameters["offset"],
-                        parameters["decay"],
-                    )
-                else:
-                    t_range = np.arange(1, 306)
-                    y_mb_bay = milkbot_model(
-                        t_range,
-                        parameters["scale"],
-                        parameters["ramp"],
-                        parameters["offset"],
-                        parameters["decay"],
-                    )
-                return np.asarray(y_mb_bay)
+                y_mb_bay = milkbot_model(
+                    t_range,
+                    parameters["scale"],
+                    parameters["ramp"],
+                    parameters["offset"],
+                    parameters["decay"],
+                )
+                return np.asarray(y_mb_bay, dtype=dtype)
         else:
             raise Exception("Bayesian fitting is currently only implemented for milkbot models")
 
 
+def fit_lactation_curve_batch(
+    df: pd.DataFrame,
+    model="wood",
+    days_in_milk_col: str | None = None,
+    milking_yield_col: str | None = None,
+    test_id_col: str | None = None,
+    default_test_id: int = 0,
+    dtype=np.float64,
+    n_jobs: int | None = 1,
+) -> pd.DataFrame:
+    """Fit a lactation curve per lactation (TestId) and return all predicted curves.
+
+    The columns are extracted from `df` once, missing values are dropped in a single
+    pass and every lactation is predicted on one shared DIM range, so there is no
+    per-lactation input validation or DataFrame slicing. Fitting itself is the same
+    frequentist fit as `fit_lactation_curve`.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame with at least DaysInMilk, MilkingYield,
+            and (optionally) TestId columns (names can be provided via arguments
+            or matched via known aliases, case-insensitive).
+        model (str): "wood" (default), "wilmink", "ali_schaeffer", "fischer" or "milkbot".
+        days_in_milk_col (str | None): Optional column name override for DaysInMilk.
+        milking_yield_col (str | None): Optional column name override for MilkingYield.
+        test_id_col (str | None): Optional column name override for TestId.
+        default_test_id (int): If TestId is missing, all records are treated as one
+            lactation with this id.
+        dtype: Floating point dtype of the predicted curves, default `np.float64`.
+            Parameters are always fitted in float64.
+        n_jobs (int | None): Number of worker processes. 1 (default) fits in the
+            current process; None uses all CPUs. Lactations are independent, so they
+            are split into contiguous chunks that are fitted in parallel.
+
+    Returns:
+        pd.DataFrame: One row per TestId (index "TestId") and one column per DIM,
+            from 1 to 305 (or to the maximum DIM in `df` if greater). Lactations with
+            fewer than two valid records, or whose fit fails or needs more records
+            than available, are all NaN.
+
+    Raises:
+        Exception: If an unknown model is requested.
+        ValueError: If required columns (DaysInMilk or MilkingYield) cannot be found.
+    """
+    model = _frequentist_model_name(model)
+
+    df = standardize_lactation_columns(
+        df,
+        days_in_milk_col=days_in_milk_col,
+        milking_yield_col=milking_yield_col,
+        test_id_col=test_id_col,
+        default_test_id=default_test_id,
+        max_dim="max",
+    )
+
+    # group rows per lactation once, keeping the order of first appearance
+    codes, test_ids = pd.factorize(df["TestId"])
+    dim = df["DaysInMilk"].to_numpy(dtype=float)
+    milkrecordings = df["MilkingYield"].to_numpy(dtype=float)
+    valid = np.isfinite(dim) & np.isfinite(milkrecordings) & (codes >= 0)
+    order = np.argsort(codes[valid], kind="stable")
+    codes = codes[valid][order]
+    dim = dim[valid][order]
+    milkrecordings = milkrecordings[valid][order]
+    starts = np.searchsorted(codes, np.arange(len(test_ids) + 1))
+
+    dim_max = int(np.ceil(dim.max())) if dim.size else 0
+    t_range = np.arange(1, max(dim_max, 305) + 1, dtype=np.float64)
+
+    n_workers = os.cpu_count() if n_jobs is None else n_jobs
+    if n_workers is None or n_workers <= 1 or len(test_ids) < 2:
+        curves = _fit_curves(dim, milkrecordings, starts, model, t_range, dtype)
+    else:
+        # contiguous blocks of lactations, a few per worker to balance the load
+        bounds = np.unique(np.linspace(0, len(test_ids), 4 * n_workers + 1).astype(int))
+        chunks = [
+            (
+                dim[starts[lo] : starts[hi]],
+                milkrecordings[starts[lo] : starts[hi]],
+                starts[lo : hi + 1] - starts[lo],
+                model,
+                t_range,
+                dtype,
+            )
+            for lo, hi in zip(bounds[:-1], bounds[1:])
+        ]
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            curves = np.concatenate(list(executor.map(_fit_curves, *zip(*chunks))))
+
+    return pd.DataFrame(
+        curves,
+        index=pd.Index(test_ids, name="TestId"),
+        columns=t_range.astype(int),
+    )
+
+
+def _fit_curves(dim, milkrecordings, starts, model, t_range, dtype) -> np.ndarray:
+    """Fit each lactation `dim[starts[i]:starts[i + 1]]` and predict it on `t_range`.
+
+    Module-level so that `fit_lactation_curve_batch` can send it to worker processes.
+    """
+    model_function = _FREQUENTIST_MODELS[model]
+    curves = np.full((len(starts) - 1, t_range.size), np.nan, dtype=dtype)
+    for i in range(len(starts) - 1):
+        start, end = starts[i], starts[i + 1]
+        if end - start < 2:
+            continue
+        try:
+            params = _fit_parameters(dim[start:end], milkrecordings[start:end], model)
+        except (RuntimeError, TypeError, ValueError):
+            # no convergence, or fewer records than model parameters
+            continue
+        curves[i] = model_function(t_range, *params)
+    return curves
+
+
 def get_lc_parameters_least_squares(
     dim, milkrecordings, model="milkbot"
 ) -> tuple[float, float, float, float]:
@@ -607,10 +909,11 @@ def get_lc_parameters_least_squares(
     # ------------------------------
     # Fit using least-squares
     # ------------------------------
+    problem = _MilkBotResiduals(dim, milkrecordings)
     res = least_squares(
-        residuals_milkbot,
+        problem.residuals,
         p0,
-        args=(dim, milkrecordings),
+        jac=problem.jacobian,
         bounds=(lower, upper),
         method="trf",  # trust region reflective, works well with bounds
     )
@@ -626,8 +929,8 @@ def get_lc_parameters_least_squares(
 def get_lc_parameters(dim, milkrecordings, model="wood") -> tuple[float, ...]:
     """Fit lactation data to a model and return fitted parameters (frequentist).
 
-    Depending on `model`, this uses `scipy.optimize.minimize` and/or
-    `scipy.optimize.curve_fit` with model-specific starting values and bounds.
+    Depending on `model`, this uses `scipy.optimize.least_squares` (Wood, MilkBot)
+    or `scipy.optimize.curve_fit` with model-specific starting values and bounds.
 
     Args:
         dim (int): List/array of DIM values.
@@ -645,32 +948,114 @@ def get_lc_parameters(dim, milkrecordings, model="wood") -> tuple[float, ...]:
     # check and prepare input
     inputs = validate_and_prepare_inputs(dim, milkrecordings, model=model)
 
-    dim = inputs.dim
-    milkrecordings = inputs.milkrecordings
-    model = inputs.model
+    return _fit_parameters_cached(inputs.dim, inputs.milkrecordings, inputs.model)
+
 
+# recently fitted parameters, keyed by model and a digest of the validated inputs
+_PARAMETER_CACHE: OrderedDict = OrderedDict()
+_PARAMETER_CACHE_SIZE = 4096
+_PARAMETER_CACHE_LOCK = threading.Lock()
+
+
+def _fit_parameters_cached(dim, milkrecordings, model) -> tuple[float, ...]:
+    """`_fit_parameters` with a small LRU cache.
+
+    Characteristics such as peak yield, time to peak and persistency each refit the
+    same lactation; a repeated call with identical arrays and model returns the
+    earlier parameters instead of running the optimizer again. Cache access is
+    guarded by a lock, so threaded callers can share it; the fit itself runs unlocked.
+    """
+    key = (
+        model,
+        dim.dtype.str,
+        hashlib.blake2b(dim.tobytes(), digest_size=16).digest(),
+        hashlib.blake2b(milkrecordings.tobytes(), digest_size=16).digest(),
+    )
+    with _PARAMETER_CACHE_LOCK:
+        params = _PARAMETER_CACHE.get(key)
+        if params is not None:
+            _PARAMETER_CACHE.move_to_end(key)
+            return params
+    params = tuple(float(p) for p in _fit_parameters(dim, milkrecordings, model))
+    with _PARAMETER_CACHE_LOCK:
+        _PARAMETER_CACHE[key] = params
+        while len(_PARAMETER_CACHE) > _PARAMETER_CACHE_SIZE:
+            _PARAMETER_CACHE.popitem(last=False)
+    return params
+
+
+def _wood_initial_guess(dim, milkrecordings, lower, upper) -> np.ndarray:
+    """Starting point for the Wood fit from the log-linear form of the model.
+
+    `ln y = ln a + b ln t - c t` is linear in `(ln a, b, c)`, so one small linear
+    least-squares solve gives a start close to the optimum, which roughly halves
+    the number of optimizer iterations. Only records with positive DIM and yield
+    enter the logarithms; falls back to the fixed default start when fewer than
+    three remain.
+    """
+    positive = (dim > 0) & (milkrecordings > 0)
+    if np.count_nonzero(positive) < 3:
+        return np.array([30.0, 0.2, 0.01])
+    t = dim[positive]
+    design = np.column_stack((np.ones_like(t), np.log(t), -t))
+    coef = np.linalg.lstsq(design, np.log(milkrecordings[positive]), rcond=None)[0]
+    guess = np.array([np.exp(coef[0]), coef[1], coef[2]])
+    if not np.all(np.isfinite(guess)):
+        return np.array([30.0, 0.2, 0.01])
+    # least_squares needs a feasible start
+    return np.clip(guess, lower, upper)
+
+
+def _linear_least_squares(design, milkrecordings) -> np.ndarray:
+    """Solve a model that is linear in its parameters in one least-squares step.
+
+    Gives the optimum that `curve_fit` would iterate towards. Raises `TypeError` like
+    `curve_fit` when there are fewer records than parameters.
+    """
+    n_points, n_params = design.shape
+    if n_params > n_points:
+        raise TypeError(
+            f"The number of func parameters={n_params} must not exceed"
+            f" the number of data points={n_points}"
+        )
+    return np.linalg.lstsq(design, np.asarray(milkrecordings, dtype=float), rcond=None)[0]
+
+
+def _fit_parameters(dim, milkrecordings, model) -> tuple[float, ...]:
+    """Fit `model` to already validated DIM and milk arrays; see `get_lc_parameters`."""
     if model == "wood":
-        wood_guess = [30, 0.2, 0.01]
-        wood_bounds = [(1, 100), (0.01, 1.5), (0.0001, 0.1)]
-        wood_res = minimize(
-            wood_objective, wood_guess, args=(dim, milkrecordings), bounds=wood_bounds
+        wood_lower = np.array([1.0, 0.01, 0.0001])
+        wood_upper = np.array([100.0, 1.5, 0.1])
+        wood_guess = _wood_initial_guess(dim, milkrecordings, wood_lower, wood_upper)
+        wood_problem = _WoodResiduals(dim, milkrecordings)
+        wood_res = least_squares(
+            wood_problem.residuals,
+            wood_guess,
+            jac=wood_problem.jacobian,
+            bounds=(wood_lower, wood_upper),
+            method="trf",
+            # a, b and c differ by orders of magnitude; scale steps by the Jacobian columns
+            x_scale="jac",
         )
         a_w, b_w, c_w = wood_res.x
         return a_w, b_w, c_w
 
     elif model == "wilmink":
-        wil_guess = [10, 0.1, 30]
-        wil_params, _ = curve_fit(wilmink_model, dim, milkrecordings, p0=wil_guess)
-        a_wil, b_wil, c_wil = wil_params
         k_wil = -0.05  # set fixed
+        # linear in (a, b, c) for a fixed k, so the Jacobian is the design matrix
+        a_wil, b_wil, c_wil = _linear_least_squares(
+            wilmink_jacobian(dim, 0.0, 0.0, 0.0, k_wil), milkrecordings
+        )
         return a_wil, b_wil, c_wil, k_wil
 
     elif model == "ali_schaeffer":
-        ali_schaeffer_guess = [10, 10, -5, 1, 1]
-        ali_schaeffer_params, _ = curve_fit(
-            ali_schaeffer_model, dim, milkrecordings, p0=ali_schaeffer_guess
+        # linear in all parameters, so the Jacobian is the design matrix; log(305/t) is
+        # undefined for t <= 0, so such records cannot inform the fit and are left out
+        positive = dim > 0
+        a_as, b_as, c_as, d_as, k_as = _linear_least_squares(
+            ali_schaeffer_jacobian(dim[positive], 0.0, 0.0, 0.0, 0.0, 0.0),
+            milkrecordings[positive],
         )
-        a_as, b_as, c_as, d_as, k_as = ali_schaeffer_params
         return a_as, b_as, c_as, d_as, k_as
 
     elif model == "fischer":
@@ -682,20 +1067,90 @@ def get_lc_parameters(dim, milkrecordings, model="wood") -> tuple[float, ...]:
             milkrecordings,
             p0=fischer_guess,
             bounds=np.transpose(fischer_bounds),
+            jac=fischer_jacobian,
         )
         a_f, b_f, c_f = fischer_params
         return a_f, b_f, c_f
 
     elif model == "milkbot":
-        mb_guess = [max(milkrecordings), 20.0, -0.7, 0.022]
-        mb_bounds = [(1, 100), (1, 100), (-600, 300), (0.0001, 0.1)]
-        mb_res = minimize(milkbot_objective, mb_guess, args=(dim, milkrecordings), bounds=mb_bounds)
+        mb_lower = np.array([1.0, 1.0, -600.0, 0.0001])
+        mb_upper = np.array([100.0, 100.0, 300.0, 0.1])
+        # least_squares needs a feasible start; the peak yield may fall outside the scale bounds
+        mb_guess = np.clip([np.max(milkrecordings), 20.0, -0.7, 0.022], mb_lower, mb_upper)
+        mb_problem = _MilkBotResiduals(dim, milkrecordings)
+        mb_res = least_squares(
+            mb_problem.residuals,
+            mb_guess,
+            jac=mb_problem.jacobian,
+            bounds=(mb_lower, mb_upper),
+            method="trf",
+        )
         a_mb, b_mb, c_mb, d_mb = mb_res.x
         return a_mb, b_mb, c_mb, d_mb
 
     raise ValueError(f"Unknown model: {model}")
 
 
+# MilkBot API session, shared so that consecutive fits reuse open connections.
+# Created on first use, so frequentist-only use does not import requests.
+_MILKBOT_TIMEOUT = 30
+_SESSION = None
+
+
+def _make_milkbot_session() -> requests.Session:
+    """Create a pooled session with connection retries for the MilkBot API."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json"})
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def _milkbot_session() -> requests.Session:
+    """Return the shared MilkBot API session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = _make_milkbot_session()
+    return _SESSION
+
+
+# Chen et al. priors per parity group (3 = parity >= 3)
+_CHEN_PRIORS = {
+    1: {
+        "scale": {"mean": 34.11, "sd": 7},
+        "ramp": {"mean": 29.96, "sd": 3},
+        "decay": {"mean": 0.001835, "sd": 0.000738},
+        "offset": {"mean": -0.5, "sd": 0.02},
+        "seMilk": 4,
+        "milkUnit": "kg",
+    },
+    2: {
+        "scale": {"mean": 44.26, "sd": 9.57},
+        "ramp": {"mean": 22.52, "sd": 3},
+        "decay": {"mean": 0.002745, "sd": 0.000979},
+        "offset": {"mean": -0.78, "sd": 0.07},
+        "seMilk": 4,
+        "milkUnit": "kg",
+    },
+    3: {
+        "scale": {"mean": 48.41, "sd": 10.66},
+        "ramp": {"mean": 22.54, "sd": 8.724},
+        "decay": {"mean": 0.002997, "sd": 0.000972},
+        "offset": {"mean": 0.0, "sd": 0.03},
+        "seMilk": 4,
+        "milkUnit": "kg",
+    },
+}
+
+
 def get_chen_priors(parity: int) -> dict:
     """
     Return Chen et al. priors in MilkBot format.
@@ -711,35 +1166,12 @@ def get_chen_priors(parity: int) -> dict:
         - "offset": {"mean", "sd"}
         - "seMilk": Standard error of milk measurement.
         - "milkUnit": Unit string (e.g., "kg").
+
+        A fresh copy is returned, so callers may modify it freely.
     """
-    if parity == 1:
-        return {
-            "scale": {"mean": 34.11, "sd": 7},
-            "ramp": {"mean": 29.96, "sd": 3},
-            "decay": {"mean": 0.001835, "sd": 0.000738},
-            "offset": {"mean": -0.5, "sd": 0.02},
-            "seMilk": 4,
-            "milkUnit": "kg",
-        }
-
-    if parity == 2:
-        return {
-            "scale": {"mean": 44.26, "sd": 9.57},
-            "ramp": {"mean": 22.52, "sd": 3},
-            "decay": {"mean": 0.002745, "sd": 0.000979},
-            "offset": {"mean": -0.78, "sd": 0.07},
-            "seMilk": 4,
-            "milkUnit": "kg",
-        }
-
-    # parity >= 3
+    prior = _CHEN_PRIORS.get(parity, _CHEN_PRIORS[3])
     return {
-        "scale": {"mean": 48.41, "sd": 10.66},
-        "ramp": {"mean": 22.54, "sd": 8.724},
-        "decay": {"mean": 0.002997, "sd": 0.000972},
-        "offset": {"mean": 0.0, "sd": 0.03},
-        "seMilk": 4,
-        "milkUnit": "kg",
+        name: dict(value) if isinstance(value, dict) else value for name, value in prior.items()
     }
 
 
@@ -819,14 +1251,63 @@ def bayesian_fit_milkbot_single_lactation(
         milk_unit=milk_unit,
     )
 
-    dim = inputs.dim
-    milkrecordings = inputs.milkrecordings
-    breed = inputs.breed
-    parity = inputs.parity
-    continent = inputs.continent
-    custom_priors = inputs.custom_priors
-    milk_unit = inputs.milk_unit
+    return _bayesian_fit_milkbot_cached(
+        inputs.dim,
+        inputs.milkrecordings,
+        key,
+        inputs.parity,
+        inputs.breed,
+        inputs.custom_priors,
+        inputs.continent,
+        inputs.milk_unit,
+    )
+
+
+# recent MilkBot API results, keyed by a digest of the validated inputs and all options
+_BAYESIAN_CACHE: OrderedDict = OrderedDict()
+_BAYESIAN_CACHE_SIZE = 256
+_BAYESIAN_CACHE_LOCK = threading.Lock()
 
+
+def _bayesian_fit_milkbot_cached(
+    dim, milkrecordings, key, parity, breed, custom_priors, continent, milk_unit
+) -> dict:
+    """`_bayesian_fit_milkbot` with a small in-memory LRU cache.
+
+    Several characteristics of the same lactation each need the same MilkBot fit; a
+    repeated request with identical data and options returns a copy of the earlier
+    result instead of calling the API again. Failed requests are not cached. Cache
+    access is guarded by a lock, and the API key enters the cache key only as a digest.
+    """
+    cache_key = (
+        hashlib.blake2b(dim.tobytes(), digest_size=16).digest(),
+        hashlib.blake2b(milkrecordings.tobytes(), digest_size=16).digest(),
+        hashlib.blake2b(str(key).encode(), digest_size=16).digest(),
+        parity,
+        breed,
+        json.dumps(custom_priors, sort_keys=True, default=float),
+        continent,
+        milk_unit,
+    )
+    with _BAYESIAN_CACHE_LOCK:
+        fitted = _BAYESIAN_CACHE.get(cache_key)
+        if fitted is not None:
+            _BAYESIAN_CACHE.move_to_end(cache_key)
+            return dict(fitted)
+    fitted = _bayesian_fit_milkbot(
+        dim, milkrecordings, key, parity, breed, custom_priors, continent, milk_unit
+    )
+    with _BAYESIAN_CACHE_LOCK:
+        _BAYESIAN_CACHE[cache_key] = fitted
+        while len(_BAYESIAN_CACHE) > _BAYESIAN_CACHE_SIZE:
+            _BAYESIAN_CACHE.popitem(last=False)
+    return dict(fitted)
+
+
+def _bayesian_fit_milkbot(
+    dim, milkrecordings, key, parity, breed, custom_priors, continent, milk_unit, session=None
+) -> dict:
+    """Fit already validated inputs with the MilkBot API; see the public wrapper."""
     # -----------------------------
     # Select server (USA vs EU)
     # -----------------------------
@@ -838,15 +1319,17 @@ def bayesian_fit_milkbot_single_lactation(
     # -----------------------------
     # Prepare headers
     # -----------------------------
-    headers = {"Content-Type": "application/json", "X-API-KEY": key}
+    headers = {"X-API-KEY": key}
 
     # -----------------------------
     # Prepare milk points
     # -----------------------------
-    points = sorted(
-        ({"dim": int(d), "milk": float(m)} for d, m in zip(dim, milkrecordings)),
-        key=lambda p: p["dim"],
-    )
+    dim_int = dim.astype(np.int64)
+    order = np.argsort(dim_int, kind="stable")
+    points = [
+        {"dim": d, "milk": m}
+        for d, m in zip(dim_int[order].tolist(), milkrecordings[order].tolist())
+    ]
 
     # -----------------------------
     # Lactation metadata
@@ -881,7 +1364,9 @@ def bayesian_fit_milkbot_single_lactation(
     # -----------------------------
     # Call API
     # -----------------------------
-    response = requests.post(f"{base_url}/fitLactation", headers=headers, json=payload)
+    response = (session or _milkbot_session()).post(
+        f"{base_url}/fitLactation", headers=headers, json=payload, timeout=_MILKBOT_TIMEOUT
+    )
     response.raise_for_status()
     res = response.json()
 
@@ -909,7 +1394,117 @@ def bayesian_fit_milkbot_single_lactation(
     }
 
 
+def bayesian_fit_milkbot_batch(
+    df: pd.DataFrame,
+    key: str,
+    parity=3,
+    breed="H",
+    custom_priors: MilkBotPriors | str | None = None,
+    continent="USA",
+    milk_unit="kg",
+    days_in_milk_col: str | None = None,
+    milking_yield_col: str | None = None,
+    test_id_col: str | None = None,
+    default_test_id: int = 0,
+    max_workers: int = 8,
+) -> pd.DataFrame:
+    """Fit every lactation (TestId) in a DataFrame with the MilkBot API.
+
+    Each fit is one HTTP round trip, so the lactations are split over `max_workers`
+    threads that each keep their own pooled session and send requests concurrently.
+    Breed, parity, priors, continent and unit apply to all lactations and are
+    validated once.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame with at least DaysInMilk, MilkingYield,
+            and (optionally) TestId columns (names can be provided via arguments
+            or matched via known aliases, case-insensitive).
+        key: API key for MilkBot.
+        parity: Lactation number; values >= 3 are treated as one group in priors.
+        breed: "H" (Holstein) or "J" (Jersey).
+        custom_priors: "CHEN" or a dict of priors in MilkBot format, see
+            `bayesian_fit_milkbot_single_lactation`.
+        continent: "USA" or "EU" MilkBot priors and server.
+        milk_unit: Unit of milk yield measurements, "kg" or "lbs".
+        days_in_milk_col (str | None): Optional column name override for DaysInMilk.
+        milking_yield_col (str | None): Optional column name override for MilkingYield.
+        test_id_col (str | None): Optional column name override for TestId.
+        default_test_id (int): If TestId is missing, all records are treated as one
+            lactation with this id.
+        max_workers (int): Maximum number of concurrent API requests.
+
+    Returns:
+        pd.DataFrame: One row per TestId (index "TestId") with columns "scale",
+            "ramp", "decay", "offset" and "nPoints". Lactations with fewer than two
+            valid records are NaN.
+
+    Raises:
+        requests.HTTPError: For unsuccessful HTTP response codes.
+        RuntimeError: If a response format is unexpected.
+        ValueError: If required columns cannot be found or an option is invalid.
+    """
+    df = standardize_lactation_columns(
+        df,
+        days_in_milk_col=days_in_milk_col,
+        milking_yield_col=milking_yield_col,
+        test_id_col=test_id_col,
+        default_test_id=default_test_id,
+        max_dim="max",
+    )
+    inputs = validate_and_prepare_inputs(
+        df["DaysInMilk"],
+        df["MilkingYield"],
+        breed=breed,
+        parity=parity,
+        custom_priors=custom_priors,
+        continent=continent,
+        milk_unit=milk_unit,
+    )
+
+    # group rows per lactation once, keeping the order of first appearance
+    codes, test_ids = pd.factorize(df["TestId"])
+    dim = df["DaysInMilk"].to_numpy(dtype=float)
+    milkrecordings = df["MilkingYield"].to_numpy(dtype=float)
+    valid = np.isfinite(dim) & np.isfinite(milkrecordings) & (codes >= 0)
+    order = np.argsort(codes[valid], kind="stable")
+    dim = dim[valid][order]
+    milkrecordings = milkrecordings[valid][order]
+    starts = np.searchsorted(codes[valid][order], np.arange(len(test_ids) + 1))
+    to_fit = [i for i in range(len(test_ids)) if starts[i + 1] - starts[i] >= 2]
+
+    def fit_block(block):
+        with _make_milkbot_session() as session:
+            return [
+                (
+                    i,
+                    _bayesian_fit_milkbot(
+                        dim[starts[i] : starts[i + 1]],
+                        milkrecordings[starts[i] : starts[i + 1]],
+                        key,
+                        inputs.parity,
+                        inputs.breed,
+                        inputs.custom_priors,
+                        inputs.continent,
+                        inputs.milk_unit,
+                        session=session,
+                    ),
+                )
+                for i in block
+            ]
+
+    n_workers = max(1, min(max_workers, len(to_fit)))
+    blocks = [to_fit[w::n_workers] for w in range(n_workers)]
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        fitted = dict(pair for pairs in executor.map(fit_block, blocks) for pair in pairs)
+
+    columns = ["scale", "ramp", "decay", "offset", "nPoints"]
+    result = pd.DataFrame(np.nan, index=pd.Index(test_ids, name="TestId"), columns=columns)
+    for i, parameters in fitted.items():
+        result.iloc[i] = [parameters[col] for col in columns]
+    return result
+
+
 def get_milkbot_version() -> None:
     """Get the current version of the MilkBot API."""
-    r = requests.get(url="https://milkbot.com/version")
+    r = _milkbot_session().get(url="https://milkbot.com/version", timeout=_MILKBOT_TIMEOUT)
     print(r.json())
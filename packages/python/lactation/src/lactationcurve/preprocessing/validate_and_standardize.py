@@ -52,13 +52,17 @@ class MilkBotPriors(TypedDict):
     seMilk: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PreparedInputs:
     """Normalized, ready‑to‑fit inputs.
 
     This container is returned by `validate_and_prepare_inputs` and is the single
-    hand‑off object expected by the fitting routines. Arrays are finite and 1‑dimensional;
+    hand‑off object expected by the fitting routines. Arrays are finite, 1‑dimensional,
+    C‑contiguous and of the requested floating dtype (float64 by default), so the fitting
+    routines can use them without further conversion;
     categorical fields are lower/upper‑cased as appropriate and may be `None` if omitted.
+    The class uses `__slots__`, which keeps the many short‑lived instances created in
+    batch fitting small and cheap to construct.
 
     Attributes:
         dim: 1D NumPy array of day‑in‑milk values (finite; same length as `milkrecordings`).
@@ -101,6 +105,7 @@ def validate_and_prepare_inputs(
     lactation_length=None,
     milk_unit="kg",
     custom_priors=None,
+    dtype=np.float64,
 ) -> PreparedInputs:
     """
     Validate, normalize, and clean input data for lactation curve fitting.
@@ -138,6 +143,10 @@ def validate_and_prepare_inputs(
         Custom prior distributions for Bayesian fitting. If a dict is provided,
         it must be a dictionary of prior distributions for each parameter in the model.
         If the string ``"CHEN"`` is provided, the default Chen et al. priors are used.
+    dtype : numpy dtype, optional
+        Floating point dtype of the returned `dim` and `milkrecordings` arrays.
+        Default is ``np.float64``. ``np.float32`` halves the memory footprint
+        for large inputs at the cost of precision.
 
     Extra input for persistency calculation:
         persistency_method (String): way of calculating
@@ -192,10 +201,16 @@ def validate_and_prepare_inputs(
         if continent not in {"USA", "EU"}:
             raise ValueError("continent must be 'USA' or 'EU'")
 
-    dim = np.asarray(dim, dtype=float)
-    milkrecordings = np.asarray(milkrecordings, dtype=float)
+    dtype = np.dtype(dtype)
+    if dtype.kind != "f":
+        raise ValueError("dtype must be a floating point dtype")
 
-    mask = np.isfinite(dim) & np.isfinite(milkrecordings)
+    dim = np.asarray(dim, dtype=dtype)
+    milkrecordings = np.asarray(milkrecordings, dtype=dtype)
+
+    # one mask for both arrays, combined in place without a third temporary
+    mask = np.isfinite(dim)
+    mask &= np.isfinite(milkrecordings)
     dim = dim[mask]
     milkrecordings = milkrecordings[mask]
 
@@ -248,6 +263,21 @@ def validate_and_prepare_inputs(
     )
 
 
+# Accepted column aliases (case-insensitive), in order of preference
+_COLUMN_ALIASES = {
+    "DaysInMilk": ("daysinmilk", "dim", "testday"),
+    "MilkingYield": (
+        "milkingyield",
+        "testdaymilkyield",
+        "milkyield",
+        "yield",
+        "milkproduction",
+        "milk_yield",
+    ),
+    "TestId": ("testid", "animalid", "id"),
+}
+
+
 def standardize_lactation_columns(
     df: pd.DataFrame,
     *,
@@ -269,62 +299,40 @@ def standardize_lactation_columns(
         - TestId
     """
 
-    df = df.copy()
-
-    # Accepted aliases (case-insensitive)
-    aliases = {
-        "DaysInMilk": ["daysinmilk", "dim", "testday"],
-        "MilkingYield": [
-            "milkingyield",
-            "testdaymilkyield",
-            "milkyield",
-            "yield",
-            "milkproduction",
-            "milk_yield",
-        ],
-        "TestId": ["testid", "animalid", "id"],
-    }
-
     # Lowercase lookup → actual column name
     col_lookup = {col.lower(): col for col in df.columns}
 
-    def resolve_col(override, possible_names):
+    def resolve_col(override, canonical):
         if override:
             return col_lookup.get(override.lower())
-        for name in possible_names:
-            if name in col_lookup:
-                return col_lookup[name]
-        return None
+        return next(
+            (col_lookup[name] for name in _COLUMN_ALIASES[canonical] if name in col_lookup),
+            None,
+        )
 
     # Resolve columns
-    dim_col = resolve_col(days_in_milk_col, aliases["DaysInMilk"])
+    dim_col = resolve_col(days_in_milk_col, "DaysInMilk")
     if not dim_col:
         raise ValueError("No DaysInMilk column found.")
 
-    yield_col = resolve_col(milking_yield_col, aliases["MilkingYield"])
+    yield_col = resolve_col(milking_yield_col, "MilkingYield")
     if not yield_col:
         raise ValueError("No MilkingYield column found.")
 
-    id_col = resolve_col(test_id_col, aliases["TestId"])
+    id_col = resolve_col(test_id_col, "TestId")
+
+    # Rename to standardized names (returns a copy, the input is never modified)
+    renames = {dim_col: "DaysInMilk", yield_col: "MilkingYield"}
+    if id_col:
+        renames[id_col] = "TestId"
+    df = df.rename(columns=renames)
 
     # Create TestId if missing
     if not id_col:
         df["TestId"] = default_test_id
-        id_col = "TestId"
-
-    # Rename to standardized names
-    df = df.rename(
-        columns={
-            dim_col: "DaysInMilk",
-            yield_col: "MilkingYield",
-            id_col: "TestId",
-        }
-    )
 
     # Filter DIM
-    if isinstance(max_dim, str) and max_dim.lower() == "max":
-        df = pd.DataFrame(df)
-    else:
-        df = pd.DataFrame(df[df["DaysInMilk"] <= int(max_dim)])
+    if not (isinstance(max_dim, str) and max_dim.lower() == "max"):
+        df = df.loc[df["DaysInMilk"].to_numpy() <= int(max_dim)]
 
     return df
@@ -3,20 +3,40 @@
 import os
 
 import pytest
-from dotenv import find_dotenv, load_dotenv
 
-load_dotenv(find_dotenv())
+
+def pytest_addoption(parser):
+    """Add the --run-network option for tests that call the live MilkBot API."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' that call the live MilkBot API",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked 'network' unless --run-network is given."""
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="calls the live MilkBot API; use --run-network")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
 
 
 def milkbot_key() -> str:
-    """Return the MilkBot API key from environment."""
+    """Return the MilkBot API key from environment, reading .env if needed."""
+    from dotenv import find_dotenv, load_dotenv
+
+    load_dotenv(find_dotenv())
     key = os.getenv("milkbot_key")
     if not key:
         raise ValueError("milkbot_key not found in environment. Check your .env file.")
     return key
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def key() -> str:
-    """Fixture providing the MilkBot API key."""
+    """Fixture providing the MilkBot API key; .env is read once per session."""
     return milkbot_key()
@@ -18,6 +18,10 @@ Usage:
 
         pytest test_lactation_curve_characteristics.py -v
 
+    Include tests that call the live MilkBot API (needs milkbot_key in .env)::
+
+        pytest test_lactation_curve_characteristics.py --run-network -v
+
     Run specific marker::
 
         pytest test_lactation_curve_characteristics.py -m characteristic -v
@@ -32,14 +36,14 @@ Authors:
 """
 
 import math
-import os
+from collections import OrderedDict
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 import pytest
 import sympy as sp
-from dotenv import find_dotenv, load_dotenv
 
+import lactationcurve.fitting.lactation_curve_fitting as lcf
 from lactationcurve.characteristics import (
     calculate_characteristic,
     lactation_curve_characteristic_function,
@@ -50,24 +54,82 @@ from lactationcurve.characteristics import (
     persistency_milkbot,
     persistency_wood,
 )
+from lactationcurve.fitting import milkbot_model
 
 
-@pytest.fixture
-def key() -> str:
-    """Return the MilkBot API key from environment."""
-    load_dotenv(find_dotenv())
-    key = os.getenv("milkbot_key")
-    if not key:
-        raise ValueError("milkbot_key not found in environment. Check your .env file.")
-    return key
+# (model, characteristic, expected parameter symbols) for the symbolic checks
+MODEL_MATRIX = [
+    ("wood", "time_to_peak", {"a", "b", "c"}),
+    ("wood", "peak_yield", {"a", "b", "c"}),
+    ("wood", "cumulative_milk_yield", {"a", "b", "c"}),
+    ("brody", "cumulative_milk_yield", {"a", "b", "k1", "k2"}),
+    ("sikka", "time_to_peak", {"a", "b", "c"}),
+    ("wilmink", "time_to_peak", {"a", "b", "c", "k"}),
+    ("ali_schaeffer", "time_to_peak", {"a", "b", "c", "d", "k"}),
+]
+
+# MilkBot posterior returned by the mocked API in the offline Bayesian tests
+MOCK_MILKBOT_PARAMS = {"scale": 50.0, "ramp": 25.0, "offset": 0.0, "decay": 0.002}
+
+
+class _MockMilkBotResponse:
+    """Minimal stand-in for a successful MilkBot API response."""
+
+    def __init__(self, fitted_params):
+        self._fitted_params = fitted_params
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"fittedParams": self._fitted_params}
 
 
 @pytest.fixture
+def mock_milkbot_post(monkeypatch):
+    """Replace MilkBot API calls with a mock returning `MOCK_MILKBOT_PARAMS`.
+
+    Also starts from an empty Bayesian result cache so every fit reaches the mock.
+
+    Returns:
+        list: JSON payloads of the requests made, in order.
+    """
+    payloads = []
+
+    def mock_post(url, headers=None, json=None, timeout=None):
+        assert isinstance(json, dict)
+        payloads.append(json)
+        return _MockMilkBotResponse(dict(MOCK_MILKBOT_PARAMS))
+
+    monkeypatch.setattr(lcf._milkbot_session(), "post", mock_post)
+    monkeypatch.setattr(lcf, "_BAYESIAN_CACHE", OrderedDict())
+    return payloads
+
+
+@pytest.fixture(scope="module")
+def mock_milkbot_curve():
+    """Daily yields of the `MOCK_MILKBOT_PARAMS` curve for DIM 1-305.
+
+    Returns:
+        np.ndarray: Predicted yield for DIM 1, 2, ..., 305.
+    """
+    p = MOCK_MILKBOT_PARAMS
+    t = np.arange(1, 306, dtype=np.float64)
+    return milkbot_model(t, p["scale"], p["ramp"], p["offset"], p["decay"])
+
+
+@pytest.fixture(scope="session")
 def test_df():
+    """Read the example lactation once per session as read-only float64 arrays."""
     data_path = Path(__file__).parent / "test_data" / "l2_anim2_herd654.csv"
-    df = pd.read_csv(data_path, sep=",")
-    dim = df.DaysInMilk.values
-    my = df.TestDayMilkYield.values
+    with open(data_path) as f:
+        header = f.readline().strip().split(",")
+    cols = (header.index("DaysInMilk"), header.index("TestDayMilkYield"))
+    arr = np.loadtxt(data_path, delimiter=",", skiprows=1, usecols=cols, dtype=np.float64)
+    dim = np.ascontiguousarray(arr[:, 0])
+    my = np.ascontiguousarray(arr[:, 1])
+    dim.setflags(write=False)
+    my.setflags(write=False)
     return dim, my
 
 
@@ -90,40 +152,6 @@ class TestCharacteristicFunction:
         with pytest.raises(Exception, match="Unknown model"):
             lactation_curve_characteristic_function(model="not_a_model")
 
-    def test_wood_time_to_peak_returns_expr_params_and_func(self):
-        """Test for correct symbolic expression, parameter symbols,
-        and callable for Wood time to peak.
-        """
-        expr, params, func = lactation_curve_characteristic_function(
-            model="wood", characteristic="time_to_peak"
-        )
-        assert isinstance(expr, sp.Expr)
-        assert all(isinstance(s, sp.Symbol) for s in params)
-        assert {s.name for s in params} == {"a", "b", "c"}
-        assert callable(func)
-
-    def test_wood_peak_yield_returns_expr_params_and_func(self):
-        """Test for correct symbolic expression, parameter symbols,
-        and callable for Wood peak yield.
-        """
-        expr, params, func = lactation_curve_characteristic_function(
-            model="wood", characteristic="peak_yield"
-        )
-        assert isinstance(expr, sp.Expr)
-        assert {s.name for s in params} == {"a", "b", "c"}
-        assert callable(func)
-
-    def test_wood_cumulative_returns_expr_params_and_func(self):
-        """Test for correct symbolic expression, parameter symbols,
-        and callable for Wood cumulative yield.
-        """
-        expr, params, func = lactation_curve_characteristic_function(
-            model="wood", characteristic="cumulative_milk_yield"
-        )
-        assert isinstance(expr, sp.Expr)
-        assert {s.name for s in params} == {"a", "b", "c"}
-        assert callable(func)
-
     def test_default_returns_dict_with_all_four(self):
         """Test that the default call returns a dict with all four
         characteristics for the Wood model.
@@ -141,30 +169,55 @@ class TestCharacteristicFunction:
         assert isinstance(func, dict)
         assert callable(list(func.values())[0])
 
-    def test_brody_cumulative_returns_expr_params_and_func(self):
+    def test_func_accepts_numpy_arrays(self):
+        """Test that the generated function evaluates element-wise on parameter arrays."""
+        _, _, func = lactation_curve_characteristic_function("wood", "cumulative_milk_yield")
+        a = np.array([25.0, 30.0, 35.0])
+        values = func(a, 0.2, 0.004)
+        assert values.shape == (3,)
+        assert values[1] == pytest.approx(func(30.0, 0.2, 0.004))
+
+    def test_cache_returns_same_objects_and_respects_lactation_length(self):
+        """Test that repeated calls reuse the cached result, per lactation length."""
+        first = lactation_curve_characteristic_function("wood", "cumulative_milk_yield")
+        again = lactation_curve_characteristic_function("WOOD", "cumulative_milk_yield")
+        assert again[0] is first[0] and again[2] is first[2]
+
+        longer = lactation_curve_characteristic_function(
+            "wood", "cumulative_milk_yield", lactation_length=400
+        )
+        assert longer[2](30, 0.2, 0.004) > first[2](30, 0.2, 0.004)
+
+    def test_characteristics_share_one_derivation(self):
+        """Test that all characteristics of a model reuse the same symbolic derivation."""
+        all_expr, _, _ = lactation_curve_characteristic_function("wood", None)
+        for name in ("time_to_peak", "peak_yield"):
+            expr, _, _ = lactation_curve_characteristic_function("wood", name)
+            assert expr is all_expr[name]
+        for name in ("cumulative_milk_yield", "persistency"):
+            expr, _, _ = lactation_curve_characteristic_function("wood", name)
+            assert expr == all_expr[name]
+
+    def test_lactation_length_is_substituted_in_derivation(self):
+        """Test that a new lactation length reuses the derivation with the length filled in."""
+        expr, _, func = lactation_curve_characteristic_function(
+            "wood", "cumulative_milk_yield", lactation_length=250
+        )
+        assert {s.name for s in expr.free_symbols} == {"a", "b", "c"}
+        days = np.arange(0, 250_001) / 1000
+        numeric = np.trapezoid(30 * days**0.2 * np.exp(-0.004 * days), days)
+        assert func(30, 0.2, 0.004) == pytest.approx(numeric, rel=1e-6)
+
+    @pytest.mark.parametrize("model,characteristic,expected_symbols", MODEL_MATRIX)
+    def test_models_return_expected_symbols(self, model, characteristic, expected_symbols):
         """Test for correct symbolic expression, parameter symbols,
-        and callable for Brody cumulative yield.
+        and callable for each model and characteristic.
         """
         expr, params, func = lactation_curve_characteristic_function(
-            "brody", characteristic="cumulative_milk_yield"
+            model=model, characteristic=characteristic
         )
         assert isinstance(expr, sp.Expr)
-        assert {s.name for s in params} == {"a", "b", "k1", "k2"}
-        assert callable(func)
-
-    @pytest.mark.parametrize(
-        "model,expected_symbols",
-        [
-            ("sikka", {"a", "b", "c"}),
-            ("wilmink", {"a", "b", "c", "k"}),
-            ("ali_schaeffer", {"a", "b", "c", "d", "k"}),
-        ],
-    )
-    def test_models_return_expected_symbols(self, model, expected_symbols):
-        """Test that the correct parameter symbols are returned for each model."""
-        _, params, func = lactation_curve_characteristic_function(
-            model=model, characteristic="time_to_peak"
-        )
+        assert all(isinstance(s, sp.Symbol) for s in params)
         assert {s.name for s in params} == expected_symbols
         assert callable(func)
 
@@ -187,20 +240,25 @@ class TestPersistencyFunctions:
         with known input and output."""
         result = persistency_wood(2, 0.5)
         expected = -(2 + 1) * math.log(0.5)  # = -3 * ln(0.5)
-        assert pytest.approx(result, rel=1e-9) == expected
+        assert math.isclose(result, expected, rel_tol=1e-9)
 
     def test_persistency_wood_type(self):
         """Test that persistency_wood returns a float value."""
         result = persistency_wood(1, 0.8)
         assert isinstance(result, float)
 
+    def test_persistency_wood_nonpositive_c_raises(self):
+        """Test that ValueError is raised for a non-positive Wood decay parameter."""
+        with pytest.raises(ValueError):
+            persistency_wood(1, 0)
+
     def test_persistency_milkbot_basic(self):
         """Test for correct persistency calculation for the MilkBot
         model with known input and output.
         """
         result = persistency_milkbot(2)
         expected = 0.693 / 2
-        assert pytest.approx(result, rel=1e-9) == expected
+        assert math.isclose(result, expected, rel_tol=1e-9)
 
     def test_persistency_milkbot_type(self):
         """Test that persistency_milkbot returns a float value."""
@@ -316,15 +374,16 @@ class TestCalculateCharacteristicBayesian:
     Validate Bayesian characteristic extraction using MilkBot.
 
     It covers Bayesian fitting and characteristic calculations,
-    including API integration and both literature and derived
-    persistency methods.
+    including both literature and derived persistency methods,
+    against a mocked MilkBot API with a known posterior. One smoke
+    test calls the live API.
 
     Attributes:
         Tests cover: calculate_characteristic (MilkBot, Bayesian),
         all characteristic types, API key usage.
     """
 
-    def test_time_to_peak_bayesian_milkbot(self, test_df, key):
+    def test_time_to_peak_bayesian_milkbot(self, test_df, mock_milkbot_post):
         """Test for correct time to peak calculation for the MilkBot model (Bayesian)."""
         dim, my = test_df
         result = calculate_characteristic(
@@ -333,14 +392,17 @@ class TestCalculateCharacteristicBayesian:
             model="milkbot",
             characteristic="time_to_peak",
             fitting="Bayesian",
-            key=key,
+            key="test-key",
         )
-        expected = 35
+        # analytic peak of the mocked curve, checked on a 0.001-day grid
+        p = MOCK_MILKBOT_PARAMS
+        t = np.linspace(0, 305, 305_001)
+        y = milkbot_model(t, p["scale"], p["ramp"], p["offset"], p["decay"])
         assert isinstance(result, float)
-        assert 0 < result < 305
-        assert pytest.approx(result, abs=1) == expected
+        assert len(mock_milkbot_post) == 1
+        assert pytest.approx(result, abs=1e-3) == t[np.argmax(y)]
 
-    def test_peak_yield_bayesian_milkbot(self, test_df, key):
+    def test_peak_yield_bayesian_milkbot(self, test_df, mock_milkbot_post):
         """Test for correct peak yield calculation for the MilkBot model (Bayesian)."""
         dim, my = test_df
         result = calculate_characteristic(
@@ -349,14 +411,15 @@ class TestCalculateCharacteristicBayesian:
             model="milkbot",
             characteristic="peak_yield",
             fitting="Bayesian",
-            key=key,
+            key="test-key",
         )
-        expected = 48
+        p = MOCK_MILKBOT_PARAMS
+        t = np.linspace(0, 305, 305_001)
+        y = milkbot_model(t, p["scale"], p["ramp"], p["offset"], p["decay"])
         assert isinstance(result, float)
-        assert result > 0
-        assert pytest.approx(result, abs=2) == expected
+        assert pytest.approx(result, rel=1e-6) == y.max()
 
-    def test_cumulative_bayesian_milkbot(self, test_df, key):
+    def test_cumulative_bayesian_milkbot(self, test_df, mock_milkbot_post):
         """Test for correct cumulative yield calculation for the MilkBot model (Bayesian)."""
         dim, my = test_df
         result = calculate_characteristic(
@@ -365,14 +428,15 @@ class TestCalculateCharacteristicBayesian:
             model="milkbot",
             characteristic="cumulative_milk_yield",
             fitting="Bayesian",
-            key=key,
+            key="test-key",
         )
-        expected = 10550
+        p = MOCK_MILKBOT_PARAMS
+        t = np.linspace(0, 305, 305_001)
+        y = milkbot_model(t, p["scale"], p["ramp"], p["offset"], p["decay"])
         assert isinstance(result, float)
-        assert result > 0
-        assert pytest.approx(result, abs=50) == expected
+        assert pytest.approx(result, rel=1e-6) == np.trapezoid(y, t)
 
-    def test_persistency_bayesian_milkbot(self, test_df, key):
+    def test_persistency_bayesian_milkbot(self, test_df, mock_milkbot_post):
         """Test for persistency calculation for the MilkBot model (Bayesian, literature method)."""
         dim, my = test_df
         result = calculate_characteristic(
@@ -381,12 +445,15 @@ class TestCalculateCharacteristicBayesian:
             model="milkbot",
             characteristic="persistency",
             fitting="Bayesian",
-            key=key,
+            key="test-key",
             persistency_method="literature",
         )
         assert isinstance(result, float)
+        assert result == pytest.approx(persistency_milkbot(MOCK_MILKBOT_PARAMS["decay"]))
 
-    def test_persistency_derived_bayesian_milkbot(self, test_df, key):
+    def test_persistency_derived_bayesian_milkbot(
+        self, test_df, mock_milkbot_post, mock_milkbot_curve
+    ):
         """Test for persistency calculation for the MilkBot model (Bayesian, derived method)."""
         dim, my = test_df
         result = calculate_characteristic(
@@ -395,10 +462,32 @@ class TestCalculateCharacteristicBayesian:
             model="milkbot",
             characteristic="persistency",
             fitting="Bayesian",
-            key=key,
+            key="test-key",
             persistency_method="derived",
         )
+        # slope from the daily peak to DIM 305 of the mocked curve
+        t_peak = int(np.argmax(mock_milkbot_curve)) + 1
+        expected = (mock_milkbot_curve[304] - mock_milkbot_curve[t_peak - 1]) / (305 - t_peak)
         assert isinstance(result, float)
+        assert result < 0
+        assert pytest.approx(result) == expected
+
+    @pytest.mark.network
+    def test_time_to_peak_bayesian_milkbot_live(self, test_df, key):
+        """Smoke test against the live MilkBot API (time to peak, Bayesian)."""
+        dim, my = test_df
+        result = calculate_characteristic(
+            dim,
+            my,
+            model="milkbot",
+            characteristic="time_to_peak",
+            fitting="Bayesian",
+            key=key,
+        )
+        expected = 35
+        assert isinstance(result, float)
+        assert 0 < result < 305
+        assert pytest.approx(result, abs=1) == expected
 
 
 @pytest.mark.errorhandling
@@ -440,7 +529,7 @@ class TestCalculateCharacteristicErrors:
                 fitting="Bayesian",
             )
 
-    def test_bayesian_non_milkbot_raises(self, test_df, key):
+    def test_bayesian_non_milkbot_raises(self, test_df):
         """Test that an Exception is raised if Bayesian fitting is
         requested for a non-MilkBot model.
         """
@@ -455,7 +544,7 @@ class TestCalculateCharacteristicErrors:
                 model="wood",
                 characteristic="time_to_peak",
                 fitting="Bayesian",
-                key=key,
+                key="test-key",
             )
 
 
@@ -24,6 +24,7 @@ Models Tested:
 Test Categories:
     - TestModelFunctions: Basic model output validity (14 models)
     - TestParameterFitting: Parameter recovery for fitted models (5 models)
+    - TestBatchFitting: Fitting many lactations from one DataFrame
     - TestEdgeCases: Invalid inputs and boundary conditions
     - TestBayesianFitting: MilkBot Bayesian API integration
 
@@ -32,6 +33,10 @@ Usage:
 
         pytest test_lactation_curve_fitting.py -v
 
+    Include tests that call the live MilkBot API (needs milkbot_key in .env)::
+
+        pytest test_lactation_curve_fitting.py --run-network -v
+
     Run specific marker::
 
         pytest test_lactation_curve_fitting.py -m models -v
@@ -43,14 +48,17 @@ Authors:
     Lucia Trapanese, Judith Osei-Tete
 """
 
-import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+import pandas as pd
 import pytest
-from dotenv import find_dotenv, load_dotenv
+import requests
 
+import lactationcurve.fitting.lactation_curve_fitting as lcf
 from lactationcurve.fitting import (
     ali_schaeffer_model,
+    bayesian_fit_milkbot_batch,
     bayesian_fit_milkbot_single_lactation,
     brody_model,
     build_prior,
@@ -59,6 +67,7 @@ from lactationcurve.fitting import (
     emmans_model,
     fischer_model,
     fit_lactation_curve,
+    fit_lactation_curve_batch,
     get_chen_priors,
     get_lc_parameters,
     get_lc_parameters_least_squares,
@@ -73,16 +82,46 @@ from lactationcurve.fitting import (
 )
 
 
-@pytest.fixture
-def milkbot_api_key() -> str:
-    """Return the MilkBot API key from environment."""
-    load_dotenv(find_dotenv())
-    key = os.getenv("milkbot_key")
-    if not key:
-        raise ValueError("milkbot_key not found in environment. Check your .env file.")
+@pytest.fixture(scope="session")
+def milkbot_api_key(key) -> str:
+    """Return the MilkBot API key loaded from .env by conftest."""
     return key
 
 
+class _MockMilkBotResponse:
+    """Minimal stand-in for a successful MilkBot API response."""
+
+    def __init__(self, fitted_params):
+        self._fitted_params = fitted_params
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"fittedParams": self._fitted_params}
+
+
+@pytest.fixture
+def mock_milkbot_post(monkeypatch):
+    """Replace MilkBot API calls with a mock that records each request payload.
+
+    Also starts from an empty Bayesian result cache so every fit reaches the mock.
+
+    Returns:
+        list: JSON payloads of the requests made, in order.
+    """
+    payloads = []
+
+    def mock_post(url, headers=None, json=None, timeout=None):
+        assert isinstance(json, dict)
+        payloads.append(json)
+        return _MockMilkBotResponse({"scale": 30, "ramp": 20, "decay": 0.002, "offset": 0})
+
+    monkeypatch.setattr(lcf._milkbot_session(), "post", mock_post)
+    monkeypatch.setattr(lcf, "_BAYESIAN_CACHE", lcf.OrderedDict())
+    return payloads
+
+
 @pytest.mark.utility
 class TestUtilityFunctions:
     """Test utility and helper functions for lactation curve fitting."""
@@ -123,47 +162,220 @@ class TestUtilityFunctions:
             assert isinstance(prior["seMilk"], (int, float)), "seMilk should be numeric"
 
 
-@pytest.fixture
+def _read_only(array):
+    """Mark a session-scoped fixture array read-only so tests cannot change it."""
+    array.setflags(write=False)
+    return array
+
+
+@pytest.fixture(scope="session")
 def sample_dim():
     """Standard DIM array for testing (1-199 days).
 
     Returns:
-        np.ndarray: Days in milk from 1 to 199.
+        np.ndarray: Days in milk from 1 to 199 (read-only).
     """
-    return np.arange(1, 200)
+    return _read_only(np.arange(1, 200))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def short_dim():
     """Short DIM array for quick tests.
 
     Returns:
-        np.ndarray: Days in milk from 1 to 9.
+        np.ndarray: Days in milk from 1 to 9 (read-only).
     """
-    return np.arange(1, 10)
+    return _read_only(np.arange(1, 10))
 
 
 @pytest.fixture
+def rng():
+    """Seeded random generator, so noisy inputs are the same on every run.
+
+    Returns:
+        np.random.Generator: PCG64 generator seeded with 42.
+    """
+    return np.random.default_rng(42)
+
+
+@pytest.fixture(scope="session")
+def sample_milk(sample_dim):
+    """Random milk yields (20-40 kg) matching `sample_dim`, drawn once per session.
+
+    Returns:
+        np.ndarray: 199 read-only yields from a generator seeded with 123.
+    """
+    return _read_only(np.random.default_rng(123).uniform(20, 40, size=len(sample_dim)))
+
+
+@pytest.fixture(scope="session")
+def short_milk(short_dim):
+    """Random milk yields (20-40 kg) matching `short_dim`, drawn once per session.
+
+    Returns:
+        np.ndarray: 9 read-only yields from a generator seeded with 123.
+    """
+    return _read_only(np.random.default_rng(123).uniform(20, 40, size=len(short_dim)))
+
+
+@pytest.fixture(scope="session")
+def wood_synth_data(sample_dim):
+    """Noiseless Wood curve on `sample_dim`.
+
+    Returns:
+        tuple: True parameters `(a, b, c)` and the read-only yields.
+    """
+    true_params = (30, 0.2, 0.003)
+    return true_params, _read_only(wood_model(sample_dim, *true_params))
+
+
+@pytest.fixture(scope="session")
+def wilmink_synth_data(sample_dim):
+    """Noiseless Wilmink curve on `sample_dim`.
+
+    Returns:
+        tuple: True parameters `(a, b, c, k)` and the read-only yields.
+    """
+    true_params = (30, 0.1, 10, -0.05)
+    return true_params, _read_only(wilmink_model(sample_dim, *true_params))
+
+
+@pytest.fixture(scope="session")
+def ali_schaeffer_synth_data(sample_dim):
+    """Noiseless Ali-Schaeffer curve on `sample_dim`.
+
+    Returns:
+        tuple: True parameters `(a, b, c, d, k)` and the read-only yields.
+    """
+    true_params = (25, 5, -2, 1, 0.5)
+    return true_params, _read_only(ali_schaeffer_model(sample_dim, *true_params))
+
+
+@pytest.fixture(scope="session")
+def fischer_synth_data(sample_dim):
+    """Noiseless Fischer curve on `sample_dim`.
+
+    Returns:
+        tuple: True parameters `(a, b, c)` and the read-only yields.
+    """
+    true_params = (30, 0.01, 0.01)
+    return true_params, _read_only(fischer_model(sample_dim, *true_params))
+
+
+@pytest.fixture(scope="session")
+def milkbot_synth_data(sample_dim):
+    """Noiseless MilkBot curve on `sample_dim`.
+
+    Returns:
+        tuple: True parameters `(a, b, c, d)` and the read-only yields.
+    """
+    true_params = (40, 30, 10, 0.005)
+    return true_params, _read_only(milkbot_model(sample_dim, *true_params))
+
+
+@pytest.fixture(scope="session")
 def sample_lactation_data():
     """Realistic lactation curve data for testing.
 
     Returns:
         tuple: A tuple containing:
-            - list of int: DIM values (10 time points)
-            - list of float: Milk yield values (kg/day)
+            - np.ndarray: DIM values (10 time points, float64, read-only)
+            - np.ndarray: Milk yield values (kg/day, float64, read-only)
+    """
+    dim = np.array([1, 5, 10, 20, 50, 100, 150, 200, 250, 300], dtype=np.float64)
+    milkrecordings = np.array([10, 12, 15, 18, 22, 25, 23, 20, 18, 15], dtype=np.float64)
+    return _read_only(dim), _read_only(milkrecordings)
+
+
+@pytest.fixture(scope="session")
+def small_inputs():
+    """Five early-lactation records used by the single-lactation API tests.
+
+    Returns:
+        tuple: Read-only float64 DIM and milk yield arrays.
+    """
+    dim = np.array([1, 5, 10, 20, 50], dtype=np.float64)
+    milkrecordings = np.array([10, 12, 15, 18, 22], dtype=np.float64)
+    return _read_only(dim), _read_only(milkrecordings)
+
+
+@pytest.fixture(scope="session")
+def minimal_inputs():
+    """Four records, the smallest lactation sent to the MilkBot API in tests.
+
+    Returns:
+        tuple: Read-only float64 DIM and milk yield arrays.
     """
-    return [1, 5, 10, 20, 50, 100, 150, 200, 250, 300], [
-        10,
-        12,
-        15,
-        18,
-        22,
-        25,
-        23,
-        20,
-        18,
-        15,
-    ]
+    dim = np.array([1, 5, 13, 67], dtype=np.float64)
+    milkrecordings = np.array([10, 12, 15, 30], dtype=np.float64)
+    return _read_only(dim), _read_only(milkrecordings)
+
+
+@pytest.fixture(scope="module")
+def chen_priors():
+    """Chen et al. priors for parities 1, 2 and 3, built once per module.
+
+    Returns:
+        dict: `get_chen_priors(parity)` keyed by parity. Tests must not modify it.
+    """
+    return {parity: get_chen_priors(parity) for parity in (1, 2, 3)}
+
+
+# DIM/yield series and (parity, breed, continent) options of the parametrized live API tests
+MILKBOT_OPTION_DIM = _read_only(np.array([1, 5, 10, 20, 50, 100, 150, 200], dtype=np.float64))
+MILKBOT_OPTION_MILK = _read_only(np.array([10, 12, 15, 18, 22, 25, 23, 20], dtype=np.float64))
+MILKBOT_OPTIONS = [
+    (1, "H", "USA"),
+    (2, "H", "USA"),
+    (3, "H", "USA"),
+    (2, "J", "USA"),
+    (2, "H", "EU"),
+]
+
+
+@pytest.fixture(scope="session")
+def milkbot_results(milkbot_api_key):
+    """MilkBot API fits for every entry of `MILKBOT_OPTIONS`, requested concurrently.
+
+    The live API tests only differ in their options, so all fits are sent once per
+    session over 10 threads instead of one round trip per test.
+
+    Returns:
+        dict: Fitted parameters keyed by `(parity, breed, continent)`.
+    """
+
+    def fit(options):
+        parity, breed, continent = options
+        return bayesian_fit_milkbot_single_lactation(
+            MILKBOT_OPTION_DIM,
+            MILKBOT_OPTION_MILK,
+            milkbot_api_key,
+            parity=parity,
+            breed=breed,
+            continent=continent,
+        )
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        return dict(zip(MILKBOT_OPTIONS, executor.map(fit, MILKBOT_OPTIONS)))
+
+
+# one plausible parameter set per model, evaluated together in test_models_produce_valid_output
+MODEL_PARAMS = [
+    (milkbot_model, (30, 50, 10, 0.01)),
+    (wood_model, (20, 0.2, 0.01)),
+    (wilmink_model, (30, 0.05, 5)),
+    (ali_schaeffer_model, (10, 5, -2, 1, 0.5)),
+    (fischer_model, (25, 0.01, 0.01)),
+    (brody_model, (30, 0.01)),
+    (sikka_model, (20, 0.01, 0.0001)),
+    (nelder_model, (1, 0.1, 0.01)),
+    (dhanoa_model, (10, 0.5, 0.01)),
+    (emmans_model, (20, 0.1, 0.01, 2)),
+    (hayashi_model, (2, 30, 10, 0.5)),
+    (rook_model, (20, 1, 1, 0.01)),
+    (dijkstra_model, (30, 0.1, 0.01, 0.01)),
+    (prasad_model, (10, 0.1, 0.001, 5)),
+]
 
 
 @pytest.mark.models
@@ -178,31 +390,19 @@ class TestModelFunctions:
         Sikka, Nelder, Dhanoa, Emmans, Hayashi, Rook, Dijkstra, Prasad.
     """
 
-    @pytest.mark.parametrize(
-        "model, params",
-        [
-            (milkbot_model, (30, 50, 10, 0.01)),
-            (wood_model, (20, 0.2, 0.01)),
-            (wilmink_model, (30, 0.05, 5)),
-            (ali_schaeffer_model, (10, 5, -2, 1, 0.5)),
-            (fischer_model, (25, 0.01, 0.01)),
-            (brody_model, (30, 0.01)),
-            (sikka_model, (20, 0.01, 0.0001)),
-            (nelder_model, (1, 0.1, 0.01)),
-            (dhanoa_model, (10, 0.5, 0.01)),
-            (emmans_model, (20, 0.1, 0.01, 2)),
-            (hayashi_model, (2, 30, 10, 0.5)),
-            (rook_model, (20, 1, 1, 0.01)),
-            (dijkstra_model, (30, 0.1, 0.01, 0.01)),
-            (prasad_model, (10, 0.1, 0.001, 5)),
-        ],
-    )
-    def test_models_produce_valid_output(self, model, params):
+    def test_models_produce_valid_output(self):
         """Test that each model produces a valid numpy array with finite values."""
-        t = np.array([1, 10, 100, 150, 200, 300])
-        y = model(t, *params)
-        assert isinstance(y, np.ndarray)
-        assert np.all(np.isfinite(y))
+        t = np.arange(1, 301)
+        for model, params in MODEL_PARAMS:
+            y = model(t, *params)
+            assert isinstance(y, np.ndarray), f"{model.__name__} should return an array"
+            assert np.all(np.isfinite(y)), f"{model.__name__} produced non-finite values"
+
+    def test_dijkstra_small_saturation_rate(self):
+        """Should approach a * exp((b - d) * t) as c -> 0 without cancellation error."""
+        t = np.array([1.0, 10.0, 100.0, 300.0])
+        y = dijkstra_model(t, 20, 0.01, 1e-12, 0.003)
+        np.testing.assert_allclose(y, 20 * np.exp((0.01 - 0.003) * t), rtol=1e-9)
 
     def test_model_output_shape_matches_input(self):
         """Should produce output array with same shape as input DIM array."""
@@ -226,20 +426,23 @@ class TestModelFunctions:
         assert len(y) == len(t), f"Output length {len(y)} should match input length {len(t)}"
         assert len(y) == 199, "Should have 199 values for DIM 1-199"
 
-    def test_fitted_parameters_have_correct_length(self, sample_dim):
+    def test_fitted_parameters_have_correct_length(
+        self, sample_dim, wood_synth_data, wilmink_synth_data, milkbot_synth_data
+    ):
         """Should return correct number of parameters for each model."""
-        y = wood_model(sample_dim, 30, 0.2, 0.003)
+        _, y = wood_synth_data
         params = get_lc_parameters(sample_dim, y, model="wood")
         assert len(params) == 3, "Wood model should return 3 parameters"
 
-        y_wilmink = wilmink_model(sample_dim, 30, 0.1, 10, -0.05)
+        _, y_wilmink = wilmink_synth_data
         params_wilmink = get_lc_parameters(sample_dim, y_wilmink, model="wilmink")
         assert len(params_wilmink) == 4, "Wilmink model should return 4 parameters"
 
-        y_milkbot = milkbot_model(sample_dim, 40, 30, 10, 0.005)
+        _, y_milkbot = milkbot_synth_data
         params_milkbot = get_lc_parameters(sample_dim, y_milkbot, model="milkbot")
         assert len(params_milkbot) == 4, "MilkBot model should return 4 parameters"
 
+    @pytest.mark.network
     def test_fit_lactation_curve_output_length(self, sample_lactation_data, milkbot_api_key):
         """Should produce curve values covering full lactation period."""
         dim, milkrecordings = sample_lactation_data
@@ -275,46 +478,115 @@ class TestParameterFitting:
         - MilkBot least squares (alternative fitting method)
     """
 
-    def test_wood_recovers_parameters(self, sample_dim):
+    def test_repeated_fit_reuses_cached_parameters(self, sample_dim, monkeypatch):
+        """A repeated fit with identical inputs should not run the optimizer again."""
+        calls = []
+        fit = lcf._fit_parameters
+
+        def counting_fit(dim, milkrecordings, model):
+            calls.append(model)
+            return fit(dim, milkrecordings, model)
+
+        monkeypatch.setattr(lcf, "_fit_parameters", counting_fit)
+        monkeypatch.setattr(lcf, "_PARAMETER_CACHE", lcf.OrderedDict())
+        y = wood_model(sample_dim, 30, 0.2, 0.004)
+        first = get_lc_parameters(sample_dim, y, model="wood")
+        assert get_lc_parameters(sample_dim, y, model="wood") == first
+        fit_lactation_curve(sample_dim, y, model="wood")
+        assert calls == ["wood"]
+        get_lc_parameters(sample_dim, y * 1.01, model="wood")
+        assert calls == ["wood", "wood"]
+
+    def test_parameter_cache_size_zero_disables_cache(self, sample_dim, monkeypatch):
+        """Setting the cache size to 0 should refit every call and store nothing."""
+        monkeypatch.setattr(lcf, "_PARAMETER_CACHE", lcf.OrderedDict())
+        monkeypatch.setattr(lcf, "_PARAMETER_CACHE_SIZE", 0)
+        y = wilmink_model(sample_dim, 30, 0.1, 10)
+        get_lc_parameters(sample_dim, y, model="wilmink")
+        assert len(lcf._PARAMETER_CACHE) == 0
+
+    def test_parameter_cache_is_thread_safe(self, sample_dim, monkeypatch):
+        """Concurrent fits that keep evicting each other should not raise."""
+        monkeypatch.setattr(lcf, "_PARAMETER_CACHE", lcf.OrderedDict())
+        monkeypatch.setattr(lcf, "_PARAMETER_CACHE_SIZE", 2)
+
+        def fit(i):
+            y = wilmink_model(sample_dim, 30 + i % 5, 0.1, 10)
+            return get_lc_parameters(sample_dim, y, model="wilmink")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fit, range(400)))
+        assert all(np.isclose(params[0], 30 + i % 5) for i, params in enumerate(results))
+        assert len(lcf._PARAMETER_CACHE) <= 2
+
+    def test_wood_recovers_parameters(self, sample_dim, wood_synth_data):
         """Wood model should recover known parameters from synthetic data."""
-        true_params = (30, 0.2, 0.003)
-        y = wood_model(sample_dim, *true_params)
+        true_params, y = wood_synth_data
         est_params = get_lc_parameters(sample_dim, y, model="wood")
         assert np.allclose(est_params, true_params, rtol=0.2)
 
-    def test_wilmink_recovers_parameters(self, sample_dim):
+    def test_wood_handles_record_at_dim_zero(self, sample_dim, wood_synth_data):
+        """A record at DIM 0 should neither break the start guess nor the Jacobian."""
+        true_params, y = wood_synth_data
+        dim = np.concatenate(([0.0], sample_dim))
+        milkrecordings = np.concatenate(([12.0], y))
+        jac = lcf._WoodResiduals(dim, milkrecordings).jacobian(np.array(true_params))
+        assert np.all(np.isfinite(jac))
+        est_params = get_lc_parameters(dim, milkrecordings, model="wood")
+        assert np.allclose(est_params, true_params, rtol=0.2)
+
+    def test_wilmink_recovers_parameters(self, sample_dim, wilmink_synth_data):
         """Wilmink model should recover known parameters from synthetic data."""
-        true_params = (30, 0.1, 10, -0.05)
-        y = wilmink_model(sample_dim, *true_params)
+        true_params, y = wilmink_synth_data
         est_params = get_lc_parameters(sample_dim, y, model="wilmink")
         assert np.allclose(est_params[:3], true_params[:3], rtol=0.2)
 
-    def test_ali_schaeffer_recovers_parameters(self, sample_dim):
+    def test_ali_schaeffer_recovers_parameters(self, sample_dim, ali_schaeffer_synth_data):
         """Ali-Schaeffer model should recover known parameters from synthetic data."""
-        true_params = (25, 5, -2, 1, 0.5)
-        y = ali_schaeffer_model(sample_dim, *true_params)
+        true_params, y = ali_schaeffer_synth_data
         est_params = get_lc_parameters(sample_dim, y, model="ali_schaeffer")
         assert np.allclose(est_params, true_params, rtol=0.3)
 
-    def test_fischer_recovers_parameters(self, sample_dim):
+    def test_linear_models_solve_exactly(
+        self, sample_dim, wilmink_synth_data, ali_schaeffer_synth_data
+    ):
+        """Linear models should fit noiseless synthetic data exactly."""
+        true_params, y = wilmink_synth_data
+        est_params = get_lc_parameters(sample_dim, y, model="wilmink")
+        assert np.allclose(est_params[:3], true_params[:3])
+        true_params, y = ali_schaeffer_synth_data
+        est_params = get_lc_parameters(sample_dim, y, model="ali_schaeffer")
+        assert np.allclose(est_params, true_params)
+
+    def test_linear_model_with_too_few_records_raises(self):
+        """Fewer records than parameters should raise TypeError, as curve_fit does."""
+        with pytest.raises(TypeError, match="must not exceed"):
+            get_lc_parameters([10, 50, 100], [30, 35, 28], model="ali_schaeffer")
+
+    def test_ali_schaeffer_ignores_record_at_dim_zero(self, sample_dim, ali_schaeffer_synth_data):
+        """A record at DIM 0, where log(305/t) is undefined, should not break the fit."""
+        true_params, y = ali_schaeffer_synth_data
+        dim = np.concatenate(([0.0], sample_dim))
+        milkrecordings = np.concatenate(([12.0], y))
+        est_params = get_lc_parameters(dim, milkrecordings, model="ali_schaeffer")
+        assert np.allclose(est_params, true_params)
+
+    def test_fischer_recovers_parameters(self, sample_dim, fischer_synth_data):
         """Fischer model should recover known parameters from synthetic data."""
-        true_params = (30, 0.01, 0.01)
-        y = fischer_model(sample_dim, *true_params)
+        true_params, y = fischer_synth_data
         est_params = get_lc_parameters(sample_dim, y, model="fischer")
         assert np.allclose(est_params, true_params, rtol=0.3)
 
-    def test_milkbot_recovers_parameters(self, sample_dim):
+    def test_milkbot_recovers_parameters(self, sample_dim, milkbot_synth_data):
         """MilkBot model should recover known parameters from synthetic data."""
-        true_params = (40, 30, 10, 0.005)
-        y = milkbot_model(sample_dim, *true_params)
+        true_params, y = milkbot_synth_data
         est_params = get_lc_parameters(sample_dim, y, model="milkbot")
         assert np.allclose(est_params, true_params, rtol=0.5)
 
-    def test_milkbot_least_squares_produces_valid_parameters(self, sample_dim):
+    def test_milkbot_least_squares_produces_valid_parameters(self, sample_dim, milkbot_synth_data):
         """Least squares fitting should return valid MilkBot parameters."""
-        # Generate synthetic data
-        true_params = (40, 30, 10, 0.005)
-        y = milkbot_model(sample_dim, *true_params)
+        # Synthetic data
+        _, y = milkbot_synth_data
 
         # Fit using least squares method
         est_params = get_lc_parameters_least_squares(sample_dim, y, model="milkbot")
@@ -332,10 +604,9 @@ class TestParameterFitting:
         assert -600 < c < 300, "Offset parameter 'c' should be in reasonable range"
         assert d > 0, "Decay parameter 'd' should be positive"
 
-    def test_milkbot_least_squares_recovers_parameters(self, sample_dim):
+    def test_milkbot_least_squares_recovers_parameters(self, sample_dim, milkbot_synth_data):
         """Least squares should recover known MilkBot parameters from clean data."""
-        true_params = (40, 30, 10, 0.005)
-        y = milkbot_model(sample_dim, *true_params)
+        true_params, y = milkbot_synth_data
 
         # Fit using least squares
         est_params = get_lc_parameters_least_squares(sample_dim, y, model="milkbot")
@@ -345,13 +616,11 @@ class TestParameterFitting:
             f"Estimated {est_params} should be close to true {true_params}"
         )
 
-    def test_milkbot_least_squares_handles_noisy_data(self, sample_dim):
+    def test_milkbot_least_squares_handles_noisy_data(self, sample_dim, milkbot_synth_data, rng):
         """Least squares should handle noisy data and produce finite parameters."""
         # Generate noisy synthetic data
-        true_params = (40, 30, 10, 0.005)
-        y_clean = milkbot_model(sample_dim, *true_params)
-        assert isinstance(y_clean, np.ndarray)
-        y_noisy = y_clean + np.random.normal(0, 1.0, size=y_clean.shape)
+        _, y_clean = milkbot_synth_data
+        y_noisy = y_clean + rng.normal(0, 1.0, size=y_clean.shape)
 
         # Fit noisy data
         est_params = get_lc_parameters_least_squares(sample_dim, y_noisy, model="milkbot")
@@ -361,6 +630,64 @@ class TestParameterFitting:
         assert len(est_params) == 4, "Should return 4 parameters"
 
 
+@pytest.mark.fitting
+class TestBatchFitting:
+    """Test fitting every lactation (TestId) of a DataFrame in one call."""
+
+    @pytest.fixture
+    def herd_df(self, sample_lactation_data):
+        """Two lactations with the sample data, one of them shuffled and scaled."""
+        dim, milkrecordings = sample_lactation_data
+        return pd.DataFrame(
+            {
+                "DaysInMilk": np.concatenate((dim, dim[::-1])),
+                "MilkingYield": np.concatenate((milkrecordings, 1.2 * milkrecordings[::-1])),
+                "TestId": np.repeat([1, 2], len(dim)),
+            }
+        )
+
+    @pytest.mark.parametrize("model_name", ["wood", "wilmink", "ali_schaeffer", "milkbot"])
+    def test_batch_matches_single_fits(self, herd_df, model_name):
+        """Each row should equal fit_lactation_curve on that lactation alone."""
+        curves = fit_lactation_curve_batch(herd_df, model=model_name)
+        assert list(curves.index) == [1, 2]
+        assert curves.shape == (2, 305)
+        for test_id, group in herd_df.groupby("TestId"):
+            expected = fit_lactation_curve(
+                group["DaysInMilk"], group["MilkingYield"], model=model_name
+            )
+            assert np.allclose(curves.loc[test_id].to_numpy(), expected)
+
+    def test_batch_too_few_points_is_nan(self, herd_df):
+        """A lactation with a single valid record should give an all-NaN row."""
+        extra = pd.DataFrame({"DaysInMilk": [10, 20], "MilkingYield": [20.0, np.nan], "TestId": 3})
+        curves = fit_lactation_curve_batch(pd.concat([herd_df, extra]), model="wood")
+        assert curves.loc[3].isna().all()
+        assert curves.loc[[1, 2]].notna().all().all()
+
+    def test_batch_parallel_matches_serial(self, herd_df):
+        """Fitting in worker processes should give the same curves as in-process."""
+        serial = fit_lactation_curve_batch(herd_df, model="wood")
+        parallel = fit_lactation_curve_batch(herd_df, model="wood", n_jobs=2)
+        pd.testing.assert_frame_equal(parallel, serial)
+
+    def test_batch_float32_output(self, herd_df):
+        """Curves should be returned in the requested dtype."""
+        curves = fit_lactation_curve_batch(herd_df, model="wood", dtype=np.float32)
+        assert (curves.dtypes == np.float32).all()
+
+    def test_batch_unknown_model_raises(self, herd_df):
+        """Should raise Exception for an unknown model."""
+        with pytest.raises(Exception, match="Unknown model"):
+            fit_lactation_curve_batch(herd_df, model="notamodel")
+
+    @pytest.mark.parametrize("model", [None, 5])
+    def test_batch_non_string_model_raises(self, herd_df, model):
+        """Should raise the same Exception as fit_lactation_curve for a missing or non-str model."""
+        with pytest.raises(Exception, match="Unknown model"):
+            fit_lactation_curve_batch(herd_df, model=model)
+
+
 @pytest.mark.edge_cases
 class TestEdgeCases:
     """Test handling of invalid inputs and boundary conditions.
@@ -391,9 +718,11 @@ class TestEdgeCases:
             ("milkbot", np.ndarray),
         ],
     )
-    def test_fit_lactation_curve_frequentist_models(self, sample_dim, model_name, expected_type):
+    def test_fit_lactation_curve_frequentist_models(
+        self, sample_dim, model_name, expected_type, sample_milk
+    ):
         """Should cover all frequentist model branches in fit_lactation_curve."""
-        milkrecordings = np.random.uniform(20, 40, size=len(sample_dim))
+        milkrecordings = sample_milk
         y = fit_lactation_curve(sample_dim, milkrecordings, model=model_name, fitting="frequentist")
         assert isinstance(y, expected_type)
         assert len(y) >= len(sample_dim)
@@ -409,75 +738,57 @@ class TestEdgeCases:
         ],
     )
     def test_fit_lactation_curve_frequentist_max_dim_greater_than_305(
-        self, model_name, expected_type
+        self, model_name, expected_type, rng
     ):
         """Should cover branch where max(dim) > 305 in fit_lactation_curve (frequentist)."""
         dim = np.arange(1, 400)  # 399 days
-        milkrecordings = np.random.uniform(20, 40, size=len(dim))
+        milkrecordings = rng.uniform(20, 40, size=len(dim))
+
         y = fit_lactation_curve(dim, milkrecordings, model=model_name, fitting="frequentist")
         assert isinstance(y, expected_type)
         assert len(y) == 399, f"Output length should match max(dim), got {len(y)}"
 
-    def test_fit_lactation_curve_frequentist_unknown_model_raises(self, sample_dim):
+    def test_fit_lactation_curve_float32_output(self, sample_dim):
+        """Should return the curve in the requested dtype with float64-fitted values."""
+        milkrecordings = wood_model(sample_dim, 30, 0.2, 0.004)
+        y64 = fit_lactation_curve(sample_dim, milkrecordings, model="wood")
+        y32 = fit_lactation_curve(sample_dim, milkrecordings, model="wood", dtype=np.float32)
+        assert y32.dtype == np.float32
+        np.testing.assert_allclose(y32, y64, rtol=1e-6)
+
+    def test_fit_lactation_curve_frequentist_unknown_model_raises(self, sample_dim, sample_milk):
         """Should raise Exception for unknown frequentist model."""
-        milkrecordings = np.random.uniform(20, 40, size=len(sample_dim))
+        milkrecordings = sample_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(
                 sample_dim, milkrecordings, model="notamodel", fitting="frequentist"
             )
         assert "Unknown model" in str(excinfo.value)
 
-    def test_fit_lactation_curve_bayesian_milkbot(
-        self, sample_lactation_data, milkbot_api_key, monkeypatch
-    ):
+    def test_fit_lactation_curve_bayesian_milkbot(self, sample_lactation_data, mock_milkbot_post):
         """Should cover bayesian branch for milkbot model."""
         dim, milkrecordings = sample_lactation_data
-
-        def mock_post(url, headers=None, json=None):
-            class MockResponse:
-                def raise_for_status(self):
-                    pass
-
-                def json(self):
-                    return {"fittedParams": {"scale": 1, "ramp": 2, "decay": 3, "offset": 4}}
-
-            return MockResponse()
-
-        monkeypatch.setattr("requests.post", mock_post)
         y = fit_lactation_curve(
             dim,
             milkrecordings,
             model="milkbot",
             fitting="bayesian",
-            key=milkbot_api_key,
+            key="test-key",
         )
         assert isinstance(y, np.ndarray)
         assert len(y) >= len(dim)
 
-    def test_fit_lactation_curve_bayesian_max_dim_greater_than_305(
-        self, milkbot_api_key, monkeypatch
-    ):
+    def test_fit_lactation_curve_bayesian_max_dim_greater_than_305(self, mock_milkbot_post, rng):
         """Should cover branch where max(dim) > 305 in fit_lactation_curve (bayesian)."""
         dim = np.arange(1, 400)  # 399 days
-        milkrecordings = np.random.uniform(20, 40, size=len(dim))
-
-        def mock_post(url, headers=None, json=None):
-            class MockResponse:
-                def raise_for_status(self):
-                    pass
+        milkrecordings = rng.uniform(20, 40, size=len(dim))
 
-                def json(self):
-                    return {"fittedParams": {"scale": 1, "ramp": 2, "decay": 3, "offset": 4}}
-
-            return MockResponse()
-
-        monkeypatch.setattr("requests.post", mock_post)
         y = fit_lactation_curve(
             dim,
             milkrecordings,
             model="milkbot",
             fitting="bayesian",
-            key=milkbot_api_key,
+            key="test-key",
         )
         assert isinstance(y, np.ndarray)
         assert len(y) == 399, f"Output length should match max(dim), got {len(y)}"
@@ -489,9 +800,7 @@ class TestEdgeCases:
             fit_lactation_curve(dim, milkrecordings, model="milkbot", fitting="bayesian", key=None)
         assert "Key needed to use Bayesian fitting engine milkbot" in str(excinfo.value)
 
-    def test_fit_lactation_curve_bayesian_non_milkbot_raises(
-        self, sample_lactation_data, milkbot_api_key
-    ):
+    def test_fit_lactation_curve_bayesian_non_milkbot_raises(self, sample_lactation_data):
         """Should raise Exception for bayesian fitting with non-milkbot model."""
         dim, milkrecordings = sample_lactation_data
         with pytest.raises(Exception) as excinfo:
@@ -500,7 +809,7 @@ class TestEdgeCases:
                 milkrecordings,
                 model="wood",
                 fitting="bayesian",
-                key=milkbot_api_key,
+                key="test-key",
             )
         assert "Bayesian fitting is currently only implemented for milkbot models" in str(
             excinfo.value
@@ -532,11 +841,10 @@ class TestEdgeCases:
         est_params = get_lc_parameters(x, y, model="wood")
         assert np.all(np.isfinite(est_params))
 
-    def test_fitting_with_noise(self, sample_dim):
+    def test_fitting_with_noise(self, sample_dim, wood_synth_data, rng):
         """Should handle noisy data and produce finite parameters."""
-        y = wood_model(sample_dim, 30, 0.2, 0.003)
-        assert isinstance(y, np.ndarray)
-        y_noisy = y + np.random.normal(0, 0.5, size=y.shape)
+        _, y = wood_synth_data
+        y_noisy = y + rng.normal(0, 0.5, size=y.shape)
         est_params = get_lc_parameters(sample_dim, y_noisy, model="MILKBOT")
         assert np.all(np.isfinite(est_params))
 
@@ -578,46 +886,46 @@ class TestEdgeCases:
         ):
             get_lc_parameters(x, y)
 
-    def test_invalid_model_name_raises(self, short_dim):
+    def test_invalid_model_name_raises(self, short_dim, short_milk):
         """Should raise exception for invalid model name."""
-        milkrecordings = np.random.uniform(20, 40, size=len(short_dim))
+        milkrecordings = short_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(short_dim, milkrecordings, model="nomodel")
         assert "Unknown model" in str(excinfo.value)
 
-    def test_invalid_breed_raises(self, sample_dim, milkbot_api_key):
+    def test_invalid_breed_raises(self, sample_dim, sample_milk):
         """Should raise exception for invalid breed in Bayesian fitting."""
-        milkrecordings = np.random.uniform(20, 40, size=len(sample_dim))
+        milkrecordings = sample_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(
                 sample_dim,
                 milkrecordings,
                 model="milkbot",
                 fitting="bayesian",
-                key=milkbot_api_key,
+                key="test-key",
                 breed="W",
             )
         assert "Breed must be either Holstein = 'H' or Jersey 'J'" in str(excinfo.value)
 
-    def test_invalid_continent_raises(self, short_dim, milkbot_api_key):
+    def test_invalid_continent_raises(self, short_dim, short_milk):
         """Should raise exception for invalid continent in Bayesian
         fitting (only 'USA' and 'EU' allowed).
         """
-        milkrecordings = np.random.uniform(20, 40, size=len(short_dim))
+        milkrecordings = short_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(
                 short_dim,
                 milkrecordings,
                 model="milkbot",
                 fitting="bayesian",
-                key=milkbot_api_key,
+                key="test-key",
                 continent="EW",
             )
         assert "continent must be 'USA' or 'EU'" in str(excinfo.value)
 
-    def test_invalid_fitting_method_raises(self, short_dim):
+    def test_invalid_fitting_method_raises(self, short_dim, short_milk):
         """Should raise exception for invalid fitting method."""
-        milk = np.random.uniform(20, 40, size=len(short_dim))
+        milk = short_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(short_dim, milk, model="wood", fitting="")
         assert "Fitting method must be either frequentist or bayesian" in str(excinfo.value)
@@ -629,9 +937,9 @@ class TestEdgeCases:
         with pytest.raises(ValueError):
             fit_lactation_curve(dim, milkrecordings, model="wood")
 
-    def test_bayesian_fitting_non_milkbot_raises(self, short_dim):
+    def test_bayesian_fitting_non_milkbot_raises(self, short_dim, short_milk):
         """Should raise exception when requesting Bayesian fitting for non-MilkBot models."""
-        milk = np.random.uniform(20, 40, size=len(short_dim))
+        milk = short_milk
         with pytest.raises(Exception) as excinfo:
             fit_lactation_curve(short_dim, milk, model="wood", fitting="bayesian")
         assert "Bayesian fitting is currently only implemented for milkbot models" in str(
@@ -652,9 +960,9 @@ class TestEdgeCases:
             "WILMINK",
         ],
     )
-    def test_model_name_case_insensitive(self, sample_dim, model_name):
+    def test_model_name_case_insensitive(self, sample_dim, wood_synth_data, model_name):
         """Should handle model names in any case (lowercase, uppercase, mixed)."""
-        y = wood_model(sample_dim, 30, 0.2, 0.003)
+        _, y = wood_synth_data
         # Should not raise an error for case variations
         result = get_lc_parameters(sample_dim, y, model=model_name)
         assert isinstance(result, (np.ndarray, tuple))
@@ -682,71 +990,113 @@ class TestBayesianFitting:
         Requires valid MilkBot API key from key_milkbot module.
     """
 
-    def test_bayesian_fit_with_chen_priors(
-        self, sample_lactation_data, milkbot_api_key, monkeypatch
-    ):
+    def test_bayesian_fit_with_chen_priors(self, sample_lactation_data, mock_milkbot_post):
         """Should use Chen priors when custom_priors='CHEN'."""
         dim, milkrecordings = sample_lactation_data
-        called = {}
-
-        def mock_post(url, headers=None, json=None):
-            assert isinstance(json, dict)
-            called["priors"] = json.get("priors", None)
-
-            class MockResponse:
-                def raise_for_status(self):
-                    pass
-
-                def json(self):
-                    return {"fittedParams": {"scale": 1, "ramp": 2, "decay": 3, "offset": 4}}
-
-            return MockResponse()
-
-        monkeypatch.setattr("requests.post", mock_post)
         fit_lactation_curve(
             dim,
             milkrecordings,
             model="milkbot",
             fitting="bayesian",
-            key=milkbot_api_key,
+            key="test-key",
             custom_priors="CHEN",
         )
-        assert called["priors"] is not None, "Chen priors should be included in payload"
-        assert isinstance(called["priors"], dict)
-        assert "scale" in called["priors"]
+        priors = mock_milkbot_post[-1].get("priors")
+        assert priors is not None, "Chen priors should be included in payload"
+        assert isinstance(priors, dict)
+        assert "scale" in priors
 
-    def test_bayesian_fit_with_custom_dict_priors(
-        self, sample_lactation_data, milkbot_api_key, monkeypatch
-    ):
+    def test_bayesian_chen_priors_payload_is_a_copy(self, sample_lactation_data, mock_milkbot_post):
+        """Modifying the priors of a sent payload should not leak into later requests."""
+        dim, milkrecordings = sample_lactation_data
+        expected = get_chen_priors(3)
+        for scale in (1.0, 1.1):
+            fit_lactation_curve(
+                dim,
+                milkrecordings * scale,
+                model="milkbot",
+                fitting="bayesian",
+                key="test-key",
+                parity=3,
+                custom_priors="CHEN",
+            )
+            sent = mock_milkbot_post[-1]["priors"]
+            assert sent == expected
+            sent["scale"]["mean"] = -1.0
+            sent["seMilk"] = -1
+        assert get_chen_priors(3) == expected
+
+    def test_bayesian_fit_reuses_cached_result(self, sample_lactation_data, mock_milkbot_post):
+        """A repeated Bayesian fit with identical inputs should not call the API again."""
+        dim, milkrecordings = sample_lactation_data
+        first = bayesian_fit_milkbot_single_lactation(dim, milkrecordings, key="test-key")
+        first["scale"] = 0
+        second = bayesian_fit_milkbot_single_lactation(dim, milkrecordings, key="test-key")
+        assert second["scale"] == 30
+        assert len(mock_milkbot_post) == 1
+        bayesian_fit_milkbot_single_lactation(dim, milkrecordings, key="test-key", parity=1)
+        assert len(mock_milkbot_post) == 2
+        bayesian_fit_milkbot_single_lactation(dim, milkrecordings, key="other-key")
+        assert len(mock_milkbot_post) == 3
+        assert not any("test-key" in cache_key for cache_key in lcf._BAYESIAN_CACHE), (
+            "The raw API key should not be kept in the cache"
+        )
+
+    def test_bayesian_cache_is_thread_safe(self, mock_milkbot_post, monkeypatch):
+        """Concurrent fits that keep evicting each other should not raise."""
+        monkeypatch.setattr(lcf, "_BAYESIAN_CACHE_SIZE", 2)
+        dim = np.array([1.0, 5.0, 10.0, 20.0, 50.0])
+
+        def fit(i):
+            milkrecordings = np.array([10.0, 12.0, 15.0, 18.0, 20.0 + i % 5])
+            return bayesian_fit_milkbot_single_lactation(dim, milkrecordings, key="test-key")
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(fit, range(200)))
+        assert all(result["scale"] == 30 for result in results)
+        assert len(lcf._BAYESIAN_CACHE) <= 2
+
+    def test_bayesian_batch_fits_each_lactation(self, monkeypatch):
+        """Should send one request per lactation and return NaN for too few records."""
+        requested = []
+
+        def mock_post(self, url, headers=None, json=None, timeout=None):
+            points = json["lactation"]["points"]
+            requested.append(len(points))
+            return _MockMilkBotResponse({"scale": len(points), "ramp": 2, "decay": 3, "offset": 4})
+
+        monkeypatch.setattr("requests.Session.post", mock_post)
+        df = pd.DataFrame(
+            {
+                "DaysInMilk": [10, 50, 100, 5, 60, 150, 200, 30],
+                "MilkingYield": [20.0, 30.0, 25.0, 15.0, 28.0, 24.0, 20.0, 22.0],
+                "TestId": [1, 1, 1, 2, 2, 2, 2, 3],
+            }
+        )
+        result = bayesian_fit_milkbot_batch(df, key="test-key", max_workers=2)
+        assert sorted(requested) == [3, 4]
+        assert list(result.index) == [1, 2, 3]
+        assert result.loc[1, "scale"] == 3
+        assert result.loc[2, "nPoints"] == 4
+        assert result.loc[3].isna().all()
+
+    def test_bayesian_fit_with_custom_dict_priors(self, sample_lactation_data, mock_milkbot_post):
         """Should use custom dict priors when provided."""
         dim, milkrecordings = sample_lactation_data
         custom = build_prior(1, 2, 3, 4, 5, 6, 7, 8)
-        called = {}
-
-        def mock_post(url, headers=None, json=None):
-            assert isinstance(json, dict)
-            called["priors"] = json.get("priors", None)
-
-            class MockResponse:
-                def raise_for_status(self):
-                    pass
-
-                def json(self):
-                    return {"fittedParams": {"scale": 1, "ramp": 2, "decay": 3, "offset": 4}}
-
-            return MockResponse()
-
-        monkeypatch.setattr("requests.post", mock_post)
         fit_lactation_curve(
             dim,
             milkrecordings,
             model="milkbot",
             fitting="bayesian",
-            key=milkbot_api_key,
+            key="test-key",
             custom_priors=custom,
         )
-        assert called["priors"] == custom, "Custom priors dict should be included in payload"
+        assert mock_milkbot_post[-1].get("priors") == custom, (
+            "Custom priors dict should be included in payload"
+        )
 
+    @pytest.mark.network
     def test_fit_lactation_curve_milkbot_produces_valid_output(
         self, sample_lactation_data, milkbot_api_key
     ):
@@ -766,16 +1116,17 @@ class TestBayesianFitting:
         assert np.all(np.isfinite(y))
         assert len(y) >= max(dim)
 
-    def test_bayesian_returns_valid_structure(self, milkbot_api_key):
+    @pytest.mark.network
+    def test_bayesian_returns_valid_structure(self, milkbot_api_key, small_inputs):
         """Should return dict with required parameter keys."""
-        dim = [1, 5, 10, 20, 50]
-        milkrecordings = [10, 12, 15, 18, 22]
+        dim, milkrecordings = small_inputs
         res = bayesian_fit_milkbot_single_lactation(dim, milkrecordings, milkbot_api_key)
         assert isinstance(res, dict)
         for key in ["scale", "ramp", "decay", "offset", "nPoints"]:
             assert key in res
             assert res[key] is not None
 
+    @pytest.mark.network
     def test_bayesian_handles_unordered_dim(self, milkbot_api_key):
         """Should handle unordered DIM input for Bayesian fitting."""
         dim = [50, 1, 20, 5, 10]
@@ -784,92 +1135,71 @@ class TestBayesianFitting:
         for key in ["scale", "ramp", "decay", "offset"]:
             assert isinstance(res[key], (float, int))
 
-    def test_bayesian_minimal_points(self, milkbot_api_key):
+    @pytest.mark.network
+    def test_bayesian_minimal_points(self, milkbot_api_key, minimal_inputs):
         """Should work with minimal number of data points."""
-        dim = [1, 5, 13, 67]
-        milkrecordings = [10, 12, 15, 30]
+        dim, milkrecordings = minimal_inputs
         res = bayesian_fit_milkbot_single_lactation(dim, milkrecordings, milkbot_api_key)
         assert isinstance(res["scale"], float)
 
-    def test_bayesian_invalid_key_raises(self):
-        """Should raise exception for invalid API key."""
-        dim = [1, 5, 13, 67]
-        milkrecordings = [10, 12, 15, 30]
-        with pytest.raises(Exception):
-            fit_lactation_curve(
-                dim,
-                milkrecordings,
-                model="milkbot",
-                fitting="bayesian",
-                key="INCORRECT_KEY",
-            )
+    def test_bayesian_invalid_key_raises(self, monkeypatch, minimal_inputs):
+        """Should raise HTTPError when the API rejects the key, without caching the failure."""
+        sent_keys = []
+
+        def mock_post(url, headers=None, json=None, timeout=None):
+            sent_keys.append(headers["X-API-KEY"])
+            response = requests.Response()
+            response.status_code = 401
+            response.url = url
+            return response
+
+        monkeypatch.setattr(lcf._milkbot_session(), "post", mock_post)
+        monkeypatch.setattr(lcf, "_BAYESIAN_CACHE", lcf.OrderedDict())
+        dim, milkrecordings = minimal_inputs
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                fit_lactation_curve(
+                    dim,
+                    milkrecordings,
+                    model="milkbot",
+                    fitting="bayesian",
+                    key="INCORRECT_KEY",
+                )
+        assert sent_keys == ["INCORRECT_KEY", "INCORRECT_KEY"]
 
     def test_get_priors_returns_valid_structure(self):
         """Should return dict structure for Chen priors."""
         priors = get_chen_priors(1)
         assert isinstance(priors, dict)
 
-    @pytest.mark.parametrize("parity", [1, 2, 3])
-    def test_bayesian_different_parities(self, milkbot_api_key, parity):
-        """Should handle different parity values (1, 2, 3+)."""
-        dim = [1, 5, 10, 20, 50, 100, 150, 200]
-        milkrecordings = [10, 12, 15, 18, 22, 25, 23, 20]
-        y = fit_lactation_curve(
-            dim,
-            milkrecordings,
-            model="milkbot",
-            fitting="bayesian",
-            key=milkbot_api_key,
-            parity=parity,
-            breed="H",
-            continent="USA",
-        )
-        assert isinstance(y, np.ndarray)
-        assert np.all(np.isfinite(y))
-        assert len(y) >= max(dim)
-
-    @pytest.mark.parametrize("breed", ["H", "J"])
-    def test_bayesian_different_breeds(self, milkbot_api_key, breed):
-        """Should handle different breeds (Holstein='H', Jersey='J')."""
-        dim = [1, 5, 10, 20, 50, 100, 150, 200]
-        milkrecordings = [10, 12, 15, 18, 22, 25, 23, 20]
-        y = fit_lactation_curve(
-            dim,
-            milkrecordings,
-            model="milkbot",
-            fitting="bayesian",
-            key=milkbot_api_key,
-            parity=2,
-            breed=breed,
-            continent="USA",
-        )
-        assert isinstance(y, np.ndarray)
-        assert np.all(np.isfinite(y))
-        assert len(y) >= max(dim)
+    @pytest.mark.parametrize("options", MILKBOT_OPTIONS)
+    @pytest.mark.network
+    def test_bayesian_different_options(self, milkbot_results, options):
+        """Should return finite, plausible MilkBot parameters for every option set."""
+        parameters = milkbot_results[options]
+        assert {"scale", "ramp", "offset", "decay"} <= parameters.keys()
+        assert all(np.isfinite(parameters[name]) for name in ("scale", "ramp", "offset", "decay"))
+        assert 0 < parameters["scale"] < 150
+        assert 0 < parameters["ramp"] < 200
+        assert -100 < parameters["offset"] < 100
+        assert 0 <= parameters["decay"] < 0.05
 
-    @pytest.mark.parametrize("continent", ["USA", "EU"])
-    def test_bayesian_different_continents(self, milkbot_api_key, continent):
-        """Should handle different continental priors (USA, EU)."""
-        dim = [1, 5, 10, 20, 50, 100, 150, 200]
-        milkrecordings = [10, 12, 15, 18, 22, 25, 23, 20]
-        y = fit_lactation_curve(
-            dim,
-            milkrecordings,
-            model="milkbot",
-            fitting="bayesian",
-            key=milkbot_api_key,
-            parity=2,
-            breed="H",
-            continent=continent,
-        )
-        assert isinstance(y, np.ndarray)
-        assert np.all(np.isfinite(y))
-        assert len(y) >= max(dim)
+    @pytest.mark.parametrize(
+        "first, second",
+        [((1, "H", "USA"), (3, "H", "USA")), ((2, "H", "USA"), (2, "J", "USA"))],
+    )
+    @pytest.mark.network
+    def test_bayesian_options_change_fit(self, milkbot_results, first, second):
+        """Parity and breed select different priors, so the fitted parameters should differ."""
+        names = ("scale", "ramp", "offset", "decay")
+        first_params = [milkbot_results[first][name] for name in names]
+        second_params = [milkbot_results[second][name] for name in names]
+        assert not np.allclose(first_params, second_params)
 
     @pytest.mark.parametrize("parity", [1, 2, 3])
-    def test_get_chen_priors_all_parities(self, parity):
+    def test_get_chen_priors_all_parities(self, chen_priors, parity):
         """Should return valid priors structure for all parity values."""
-        priors = get_chen_priors(parity)
+        priors = chen_priors[parity]
         assert isinstance(priors, dict)
         assert len(priors) > 0
         # Verify priors contain expected parameter keys
@@ -878,78 +1208,45 @@ class TestBayesianFitting:
             f"Priors should contain at least one of {expected_keys}"
         )
 
-    def test_get_chen_priors_detailed_structure(self):
-        """Should return priors with correct structure and value types."""
-        priors = get_chen_priors(2)
+    def test_get_chen_priors_returns_independent_copy(self):
+        """Modifying returned priors should not affect later calls."""
+        priors = get_chen_priors(1)
+        priors["scale"]["mean"] = 0.0
+        assert get_chen_priors(1)["scale"]["mean"] == 34.11
+        assert get_chen_priors(0) == get_chen_priors(5) == get_chen_priors(3)
 
-        # Should be a dictionary
+    @pytest.mark.parametrize("parity", [1, 2, 3])
+    def test_get_chen_priors_structure_and_ranges(self, chen_priors, parity):
+        """Should return priors with correct structure and reasonable values."""
+        priors = chen_priors[parity]
         assert isinstance(priors, dict), "Priors should be a dictionary"
 
-        # Should not be empty
-        assert len(priors) > 0, "Priors dictionary should not be empty"
-
-        # Main parameters should have 'mean' and 'sd' keys
-        main_params = ["scale", "ramp", "decay", "offset"]
+        # main parameters are {"mean", "sd"} dicts, other keys may be flat numbers
+        main_params = [param for param in ["scale", "ramp", "decay", "offset"] if param in priors]
+        assert main_params, "Priors should contain at least one main parameter"
         for param in main_params:
-            if param in priors:
-                value = priors[param]
-                assert isinstance(value, dict), (
-                    f"Prior value for {param} should be a dict, got {type(value)}"
-                )
-                assert "mean" in value, f"Prior {param} should have 'mean' key"
-                assert "sd" in value, f"Prior {param} should have 'sd' key"
-                assert isinstance(value["mean"], (int, float, np.number)), (
-                    f"Prior {param}['mean'] should be numeric, got {type(value['mean'])}"
-                )
-                assert isinstance(value["sd"], (int, float, np.number)), (
-                    f"Prior {param}['sd'] should be numeric, got {type(value['sd'])}"
-                )
-                assert np.isfinite(value["mean"]), f"Prior {param}['mean'] should be finite"
-                assert np.isfinite(value["sd"]), f"Prior {param}['sd'] should be finite"
-
-        # Other keys may be flat numeric values
-        for key, value in priors.items():
-            if key not in main_params:
-                if isinstance(value, (int, float, np.number)):
-                    assert np.isfinite(value), f"Prior {key} should be finite, got {value}"
-
-    def test_get_chen_priors_parameter_ranges(self):
-        """Should return priors with reasonable parameter ranges."""
-        priors = get_chen_priors(2)
-
-        # Check main parameters with nested structure
-        main_params = ["scale", "ramp", "decay", "offset"]
-        for key in main_params:
-            if key in priors and isinstance(priors[key], dict):
-                value = priors[key]
-                # Check mean values
-                assert not np.isnan(value["mean"]), f"Prior {key}['mean'] should not be NaN"
-                assert not np.isinf(value["mean"]), f"Prior {key}['mean'] should not be infinite"
-                assert abs(value["mean"]) < 1e6, (
-                    f"Prior {key}['mean']={value['mean']} seems unreasonably large"
-                )
-
-                # Check sd (standard deviation) values
-                assert not np.isnan(value["sd"]), f"Prior {key}['sd'] should not be NaN"
-                assert not np.isinf(value["sd"]), f"Prior {key}['sd'] should not be infinite"
-                assert value["sd"] > 0, f"Prior {key}['sd'] should be positive, got {value['sd']}"
-                assert value["sd"] < 1e6, (
-                    f"Prior {key}['sd']={value['sd']} seems unreasonably large"
-                )
-
-        # Check other numeric values (like seMilk)
-        for key, value in priors.items():
-            if key not in main_params and isinstance(value, (int, float, np.number)):
-                assert not np.isnan(value), f"Prior {key} should not be NaN"
-                assert not np.isinf(value), f"Prior {key} should not be infinite"
-                assert value > 0, f"Prior {key} should be positive, got {value}"
-                assert value < 1e6, f"Prior {key}={value} seems unreasonably large"
-
-    def test_get_chen_priors_consistency_across_parities(self):
+            assert isinstance(priors[param], dict), f"Prior {param} should be a dict"
+            assert {"mean", "sd"} <= priors[param].keys(), f"Prior {param} needs mean and sd"
+        others = [
+            value
+            for key, value in priors.items()
+            if key not in main_params and isinstance(value, (int, float, np.number))
+        ]
+
+        means = np.array([priors[param]["mean"] for param in main_params], dtype=float)
+        sds = np.array([priors[param]["sd"] for param in main_params], dtype=float)
+        others = np.array(others, dtype=float)
+        values = np.concatenate([means, sds, others])
+        assert np.all(np.isfinite(values)), f"Priors should be finite, got {priors}"
+        assert np.all(np.abs(values) < 1e6), f"Priors seem unreasonably large: {priors}"
+        assert np.all(sds > 0), f"Prior sd values should be positive, got {sds}"
+        assert np.all(others > 0), f"Flat prior values should be positive, got {others}"
+
+    def test_get_chen_priors_consistency_across_parities(self, chen_priors):
         """Should return different but consistent priors for different parities."""
-        priors_parity1 = get_chen_priors(1)
-        priors_parity2 = get_chen_priors(2)
-        priors_parity3 = get_chen_priors(3)
+        priors_parity1 = chen_priors[1]
+        priors_parity2 = chen_priors[2]
+        priors_parity3 = chen_priors[3]
 
         # All should have the same keys
         assert set(priors_parity1.keys()) == set(priors_parity2.keys()), (
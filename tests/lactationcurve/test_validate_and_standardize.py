@@ -0,0 +1,49 @@
+"""
+Test suite for input validation and column standardization helpers.
+
+This module covers the preprocessing helpers shared by the fitting and
+characteristic modules.
+
+Test Categories:
+    - TestValidateAndPrepareInputs: Cleaning and normalization of DIM/milk inputs
+
+Usage:
+    Run all tests::
+
+        pytest test_validate_and_standardize.py -v
+"""
+
+import numpy as np
+import pytest
+
+from lactationcurve.preprocessing import validate_and_prepare_inputs
+
+
+@pytest.mark.utility
+class TestValidateAndPrepareInputs:
+    """Test cleaning and normalization performed by validate_and_prepare_inputs."""
+
+    def test_default_dtype_is_float64(self):
+        """Should return float64 arrays by default."""
+        inputs = validate_and_prepare_inputs([1, 2, 3], [10, 20, 30])
+        assert inputs.dim.dtype == np.float64
+        assert inputs.milkrecordings.dtype == np.float64
+
+    def test_arrays_are_c_contiguous(self):
+        """Should return C-contiguous arrays, even for strided or list input."""
+        strided = np.arange(1.0, 41.0)[::2]
+        inputs = validate_and_prepare_inputs(strided, list(range(20)))
+        assert inputs.dim.flags.c_contiguous
+        assert inputs.milkrecordings.flags.c_contiguous
+
+    def test_float32_dtype(self):
+        """Should return arrays in the requested floating point dtype."""
+        inputs = validate_and_prepare_inputs([1, 2, np.nan], [10, 20, 30], dtype=np.float32)
+        assert inputs.dim.dtype == np.float32
+        assert inputs.milkrecordings.dtype == np.float32
+        assert len(inputs.dim) == 2
+
+    def test_non_float_dtype_raises(self):
+        """Should raise ValueError for a non floating point dtype."""
+        with pytest.raises(ValueError, match="floating point dtype"):
+            validate_and_prepare_inputs([1, 2, 3], [10, 20, 30], dtype=np.int16)